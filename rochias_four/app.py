@@ -1,19 +1,36 @@
 from __future__ import annotations
 
 import ctypes
-import csv
 import json
-import math
 import os
+import re
 import sys
+import threading
 import time
 import tkinter as tk
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
 from tkinter import filedialog, scrolledtext, ttk
-
-from .config import DEFAULT_INPUTS, PREFS_PATH, TICK_SECONDS, DISPLAY_Y_MAX_CM, SPEED_M_PER_S_PER_HZ
+from tkinter import font as tkfont
+
+import numpy as np
+
+from .config import (
+    DEFAULT_INPUTS,
+    DISPLAY_Y_MAX_CM,
+    PREFS_PATH,
+    SPEED_M_PER_S_PER_HZ,
+    TICK_ICONIC_SECONDS,
+    TICK_MIN_SECONDS,
+    TICK_SECONDS,
+)
 from .cells import is_cell_visible, visible_cells_for_tapis
-from .calculations import thickness_and_accum
+from .calculations import LastCalc, thickness_and_accum
 from .curves import piecewise_curve_normalized
 from .maintenance_ref import compute_times_maintenance
 from .calibration_overrides import load_anchor_from_disk
@@ -23,34 +40,8 @@ from .segments import (
     compute_segment_times_minutes,
     cumulative_markers_for_bar,
 )
-from .theme import (
-    ACCENT,
-    ACCENT_DISABLED,
-    ACCENT_HOVER,
-    ACCENT_SOFT_BG,
-    ACCENT_SOFT_BG_HOVER,
-    ACCENT_SOFT_FG,
-    BADGE_NEUTRAL_BG,
-    BADGE_READY_BG,
-    BADGE_READY_FG,
-    BADGE_IDLE_FG,
-    BG,
-    BORDER,
-    CARD,
-    DISABLED_BG,
-    DISABLED_FG,
-    FIELD,
-    FIELD_FOCUS,
-    GLOW,
-    HERO_BG,
-    HERO_DETAIL_FG,
-    MONO_FG,
-    SECONDARY,
-    SECONDARY_HOVER,
-    SUBTEXT,
-    TEXT,
-)
-from .theme_manager import ThemeManager, STYLE_NAMES, THEME_SEQUENCE
+from . import theme
+from .theme_manager import ThemeManager, STYLE_NAMES, THEME_PRESETS, THEME_SEQUENCE
 from .utils import fmt_hms, fmt_minutes
 from .widgets import Collapsible, SegmentedBar, Tooltip, VScrollFrame
 from .graphs import CELL_PROFILE_2, CELL_PROFILE_3, GraphWindow
@@ -61,6 +52,229 @@ from .details_window import DetailsWindow
 from .ui.oven_curve import OvenCurveWidget
 from .ui.theming import theme as current_plot_theme
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+
+def _dump_prefs(data: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _write_prefs(payload: bytes) -> None:
+    tmp = PREFS_PATH.with_suffix(".tmp")
+    try:
+        tmp.write_bytes(payload)
+        os.replace(tmp, PREFS_PATH)
+    except Exception:
+        pass
+
+
+def _parse_prefs(raw: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+_STAGE_STATUS = {
+    "idle": ("⏳ En attente", "BadgeIdle.TLabel"),
+    "ready": ("▶ Prêt", "BadgeReady.TLabel"),
+    "active": ("⏵ En cours", "BadgeActive.TLabel"),
+    "done": ("✓ Terminé", "BadgeDone.TLabel"),
+    "pause": ("⏸ En pause", "BadgePause.TLabel"),
+}
+
+
+def _part_texts(part: float) -> tuple[str, str]:
+    return fmt_minutes(part), f"{part:.2f} min | {fmt_hms(part * 60)}"
+
+
+_NAMED_FONTS = {
+    "AppBody": ("Segoe UI", 11),
+    "AppBodyStrong": ("Segoe UI Semibold", 11),
+    "AppSmall": ("Segoe UI", 10),
+    "AppHint": ("Segoe UI", 10, "italic"),
+    "AppCaption": ("Segoe UI Semibold", 10),
+    "AppMono": ("Consolas", 11),
+    "AppButton": ("Segoe UI", 11, "bold"),
+    "AppStageTitle": ("Segoe UI Semibold", 12),
+    "AppCardHeading": ("Segoe UI Semibold", 14),
+    "AppTitle": ("Segoe UI Semibold", 17),
+    "AppHeading": ("Segoe UI Semibold", 18),
+    "AppBig": ("Segoe UI", 20, "bold"),
+    "AppResult": ("Segoe UI", 22, "bold"),
+    "AppHeroValue": ("Segoe UI", 22, "bold"),
+    "AppHeroLabel": ("Segoe UI Semibold", 10),
+}
+
+
+@dataclass(frozen=True)
+class _BarTexts:
+    waiting: str
+    started: str
+    run_head: str
+    run_tail: str
+    done: str
+
+    @classmethod
+    def build(cls, duration_s: float, speed_hz: float) -> _BarTexts:
+        speed = f"vitesse {float(speed_hz):.2f} Hz"
+        dur = fmt_hms(duration_s)
+        return cls(
+            waiting=f"0.0% | {speed} | 00:00:00 / {dur} | en attente",
+            started=f"0.0% | {speed} | 00:00:00 / {dur} | en cours",
+            run_head=f"% | {speed} | ",
+            run_tail=f" / {dur} | en cours",
+            done=f"100% | {speed} | {dur} / {dur} | terminé",
+        )
+
+
+_KPI_TITLES = ("Temps total", "Tapis 1", "Tapis 2", "Tapis 3")
+_KPI_EMPTY = (("--", "--"),) * 3
+
+_BAR_THIRDS = (1 / 3, 2 / 3)
+_BAR_THIRD_LABELS = ("", "")
+_BAR_DURATION_HEADS = (("entry1", "Entrée"), ("transfer1", "Transfert 1"), ("transfer2", "Transfert 2"))
+
+
+_DENSITY = {
+    True: ((12, 8), {"AppCardHeading": 13, "AppHeroValue": 20, "AppHeroLabel": 9}, "Mode confortable"),
+    False: ((20, 16), {"AppCardHeading": 14, "AppHeroValue": 22, "AppHeroLabel": 10}, "Mode compact"),
+}
+
+
+_NUM_MATCH = re.compile(r"[+-]?\d*[.,]?\d*").fullmatch
+
+
+_EXPLAIN_KEYS = ("f1", "f2", "f3", "t1s_min", "t2s_min", "t3s_min", "T_total_min")
+
+
+def _accum_badge_style(pct: float) -> str:
+    if pct > 0.5:
+        return "BadgeActive.TLabel"
+    if pct < -0.5:
+        return "BadgeReady.TLabel"
+    return "BadgeNeutral.TLabel"
+
+
+@lru_cache(maxsize=128)
+def _hex_to_rgb(value: str) -> tuple[int, int, int]:
+    value = value.strip().lstrip("#")
+    if len(value) != 6:
+        value = value[:6].ljust(6, "0")
+    n = int(value, 16)
+    return (n >> 16) & 0xFF, (n >> 8) & 0xFF, n & 0xFF
+
+
+@lru_cache(maxsize=512)
+def _cached_blend(color_a: str, color_b: str, ratio: float) -> str:
+    r1, g1, b1 = _hex_to_rgb(color_a)
+    r2, g2, b2 = _hex_to_rgb(color_b)
+    r = round(r1 + (r2 - r1) * ratio)
+    g = round(g1 + (g2 - g1) * ratio)
+    b = round(b1 + (b2 - b1) * ratio)
+    return "#%06X" % ((r << 16) | (g << 8) | b)
+
+
+def _blend_colors(color_a: str, color_b: str, ratio: float) -> str:
+    return _cached_blend(color_a, color_b, max(0.0, min(1.0, float(ratio))))
+
+
+def _build_palette(colors: dict) -> dict[str, str]:
+    blend = _blend_colors
+    tint = lambda base, color, ratio: blend(base, color, ratio)
+    lighten = lambda c, amount: blend(c, "#FFFFFF", amount)
+    darken = lambda c, amount: blend(c, "#000000", amount)
+    secondary = blend(colors["panel"], colors["surface"], 0.5)
+    track = blend(colors["panel"], colors["bg"], 0.5)
+    is_dark = bool(colors.get("is_dark", False))
+    accent_hover = lighten(colors["accent"], 0.2) if is_dark else darken(colors["accent"], 0.2)
+    secondary_hover_target = colors["surface"] if is_dark else colors["bg"]
+
+    if is_dark:
+        accent_soft = tint(colors["surface"], colors["accent"], 0.18)
+        accent_soft_hover = tint(colors["surface"], colors["accent"], 0.28)
+        warn_soft = tint(colors["surface"], colors["warn"], 0.24)
+        warn_soft_hover = tint(colors["surface"], colors["warn"], 0.34)
+        success_soft = tint(colors["surface"], colors["success"], 0.26)
+        success_soft_hover = tint(colors["surface"], colors["success"], 0.36)
+        neutral_soft = tint(colors["surface"], secondary, 0.4)
+        disabled_bg = tint(colors["surface"], colors["bg"], 0.55)
+        disabled_fg = tint(colors["fg_muted"], colors["bg"], 0.45)
+        hero_bg = tint(colors["surface"], colors["accent"], 0.16)
+        hero_detail_fg = tint(colors["fg_muted"], hero_bg, 0.35)
+        tooltip_bg = tint(colors["surface"], colors["fg"], 0.6)
+        tooltip_fg = colors["fg"]
+        accent_soft_fg = colors["accent"]
+        badge_ready_fg = colors["success"]
+        badge_idle_fg = colors["fg"]
+    else:
+        accent_soft = tint(colors["bg"], colors["accent"], 0.14)
+        accent_soft_hover = tint(colors["bg"], colors["accent"], 0.24)
+        warn_soft = tint(colors["bg"], colors["warn"], 0.22)
+        warn_soft_hover = tint(colors["bg"], colors["warn"], 0.32)
+        success_soft = tint(colors["bg"], colors["success"], 0.26)
+        success_soft_hover = tint(colors["bg"], colors["success"], 0.36)
+        neutral_soft = tint(colors["bg"], secondary, 0.38)
+        disabled_bg = tint(colors["bg"], colors["panel"], 0.35)
+        disabled_fg = tint(colors["fg_muted"], colors["bg"], 0.65)
+        hero_bg = tint(colors["bg"], colors["accent"], 0.18)
+        hero_detail_fg = tint(colors["fg_muted"], hero_bg, 0.4)
+        tooltip_bg = tint(colors["bg"], colors["accent"], 0.32)
+        tooltip_fg = "#ffffff"
+        accent_soft_fg = colors["accent"]
+        badge_ready_fg = colors["success"]
+        badge_idle_fg = colors["fg_muted"]
+
+    palette = {
+        "BG": colors["bg"],
+        "CARD": colors["surface"],
+        "BORDER": colors["border"],
+        "ACCENT": colors["accent"],
+        "ACCENT_HOVER": accent_hover,
+        "ACCENT_DISABLED": blend(colors["accent"], colors["panel"], 0.7),
+        "SECONDARY": secondary,
+        "SECONDARY_HOVER": blend(secondary, secondary_hover_target, 0.4),
+        "FIELD": colors["surface"],
+        "FIELD_FOCUS": blend(colors["surface"], colors["accent"], 0.18),
+        "TEXT": colors["fg"],
+        "SUBTEXT": colors["fg_muted"],
+        "RED": colors["warn"],
+        "FILL": colors["accent"],
+        "TRACK": track,
+        "GLOW": lighten(colors["accent"], 0.45),
+        "ACCENT_SOFT_BG": accent_soft,
+        "ACCENT_SOFT_BG_HOVER": accent_soft_hover,
+        "ACCENT_SOFT_FG": accent_soft_fg,
+        "WARN_SOFT_BG": warn_soft,
+        "WARN_SOFT_BG_HOVER": warn_soft_hover,
+        "SUCCESS_SOFT_BG": success_soft,
+        "SUCCESS_SOFT_BG_HOVER": success_soft_hover,
+        "NEUTRAL_SOFT_BG": neutral_soft,
+        "DISABLED_BG": disabled_bg,
+        "DISABLED_FG": disabled_fg,
+        "MONO_FG": blend(colors["fg"], colors["accent"], 0.35),
+        "HERO_BG": hero_bg,
+        "HERO_DETAIL_FG": hero_detail_fg,
+        "TOOLTIP_BG": tooltip_bg,
+        "TOOLTIP_FG": tooltip_fg,
+        "BADGE_READY_BG": success_soft,
+        "BADGE_READY_FG": badge_ready_fg,
+        "BADGE_NEUTRAL_BG": neutral_soft,
+        "BADGE_IDLE_FG": badge_idle_fg,
+
+        # <<< ICI : jauni les "trous"
+        "HOLE": "#FACC15",         # jaune (500) -- rempli sur la partie pass?e
+        "HOLE_BORDER": "#A16207",  # jaune fonc? -- liser? sur la partie future
+    }
+    return palette
+
+
+_PALETTE_CACHE = {name: _build_palette(preset) for name, preset in THEME_PRESETS.items()}
+
 
 class FourApp(tk.Tk):
     def __init__(self):
@@ -76,181 +290,120 @@ class FourApp(tk.Tk):
         self.theme = ThemeManager(self)
         self.theme.load_saved_or(THEME_SEQUENCE[0])
         self._update_theme_palette()
-        self._sync_theme_attributes()
         self.title("Four • 3 Tapis — Référence maintenance (L/v)")
-        self.configure(bg=BG)
+        self.configure(bg=theme.BG)
         self.minsize(1100, 700)
-        self._toasts = []
-        self._cards = []
-        self._responsive_labels = []
+        self._toasts: list[tuple[tk.Toplevel, tk.Label]] = []
+        self._toast_pool: deque[tuple[tk.Toplevel, tk.Label]] = deque()
+        self._cards: list[tuple[weakref.ref, weakref.ref]] = []
+        self._responsive_labels: weakref.WeakSet = weakref.WeakSet()
+        self._themed_windows: weakref.WeakSet = weakref.WeakSet()
+        self._themed_texts: weakref.WeakSet = weakref.WeakSet()
         self.compact_mode = False
         self.feed_events: list[GapEvent] = []
+        self._open_gap: GapEvent | None = None
+        self._holes_shown: list[list[tuple[float, float]]] = [[], [], []]
         self.feed_on = True
         self.feed_timeline = FeedTimeline()
         self.fill_alpha = 0.0
         self.accum_badges: list[ttk.Label | None] = []
         self.bars_heading_label: ttk.Label | None = None
+        self._style_calls: dict[str, list[tuple]] = {}
+        self._fonts: dict[str, tkfont.Font] = {}
+        self._init_fonts()
         self._init_styles()
         self._apply_option_defaults()
         self.animating = False
         self.paused = False
         self.seg_idx = 0
-        self.seg_start = 0.0
+        self.seg_elapsed_ms = 0
         self.seg_durations = [0.0, 0.0, 0.0]
+        self.seg_dur_ms = [0, 0, 0]
+        self.seg_start_ms = [0, 0, 0, 0]
+        self.seg_minutes = (0.0, 0.0, 0.0)
         self.seg_distances = [0.0, 0.0, 0.0]
         self.seg_speeds = [0.0, 0.0, 0.0]
+        self.seg_texts = [_BarTexts.build(0.0, 0.0)] * 3
         self._after_id = None
-        self.last_calc: dict | None = None
+        self._batch_depth = 0
+        self._pending_text: dict[tk.Misc, str] = {}
+        self._tick_ms = int(TICK_SECONDS * 1000)
+        self._tick_paused_at = 0.0
+        self._tick_sched_at: float | None = None
+        self._tick_delay_ms = 0
+        self._tick_overheads: deque[float] = deque(maxlen=20)
+        self._iconic = False
+        self.last_calc: LastCalc | None = None
         self.total_duration = 0.0
-        self.notified_stage1 = False
-        self.notified_stage2 = False
         self.notified_exit = False
+        self._notify_after_id = None
         self.stage_status = []
-        self.kpi_labels = {}
-        self.stage_rows = []
+        self.kpi_total: tuple[ttk.Label, ttk.Label] | None = None
+        self.kpi_belts: list[tuple[ttk.Label, ttk.Label]] = []
+        self._stage_status_cache: dict[int, str] = {}
+        self.stage_rows: list[tuple[ttk.Label, ttk.Label, ttk.Label]] = []
+        self.total_big_var = tk.StringVar(value="Référence maintenance (L/v) : --")
+        self.analysis_info_var = tk.StringVar(value="")
+        self.lbl_total_big: ttk.Label | None = None
+        self.lbl_analysis_info: ttk.Label | None = None
         self.graph_window = None
+        self.details_window: DetailsWindow | None = None
+        self._explain_win: tk.Toplevel | None = None
+        self._explain_txt: scrolledtext.ScrolledText | None = None
+        self._explain_text = ""
+        self._explain_key: tuple | None = None
         self.operator_mode = True
         self.logo_img = None
         self._error_after = None
+        self._wrap_after = None
+        self._wrap_width = 0
+        self._wrap_applied = 0
         self.graph_bars: list[GraphBar] = []
         self.product_curve_widget: OvenCurveWidget | None = None
-        self._curve_last_tick: float | None = None
+        self._progress_key: tuple[int, int, int] | None = None
+        self._progress_px: tuple[int, int] | None = None
+        self._bar_px = 1000
         self._load_logo()
         self._build_ui()
-        load_anchor_from_disk()
         self.set_density(True)
         self._set_default_inputs()
         self.set_operator_mode(True)
-        self.bind_all("<Return>", lambda e: self.on_calculer())
-        self.bind_all("<F5>", lambda e: self.on_start())
-        self.bind_all("<space>", lambda e: self.on_pause() if self.animating else None)
-        self.bind_all("<Control-r>", lambda e: self.on_reset())
-        self.bind_all("<F1>", lambda e: self.on_explanations())
+        self.bind_all("<Return>", self.on_calculer)
+        self.bind_all("<F5>", self.on_start)
+        self.bind_all("<space>", self.on_pause)
+        self.bind_all("<Control-r>", self.on_reset)
+        self.bind_all("<F1>", self.on_explanations)
+        self.bind("<Unmap>", self._on_map_change, add="+")
+        self.bind("<Map>", self._on_map_change, add="+")
         self.protocol("WM_DELETE_WINDOW", self._on_close)
-        self.after(0, self._auto_scaling)
-        self.after(0, self._load_prefs)
-        self.after(0, self._fit_to_screen)
+        self.after_idle(self._post_init)
 
-    @staticmethod
-    def _blend_colors(color_a: str, color_b: str, ratio: float) -> str:
-        ratio = max(0.0, min(1.0, float(ratio)))
-        def _to_rgb(value: str) -> tuple[int, int, int]:
-            value = value.strip().lstrip("#")
-            if len(value) != 6:
-                value = value[:6].ljust(6, "0")
-            return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))
-        r1, g1, b1 = _to_rgb(color_a)
-        r2, g2, b2 = _to_rgb(color_b)
-        r = round(r1 + (r2 - r1) * ratio)
-        g = round(g1 + (g2 - g1) * ratio)
-        b = round(b1 + (b2 - b1) * ratio)
-        return f"#{max(0, min(255, r)):02X}{max(0, min(255, g)):02X}{max(0, min(255, b)):02X}"
+    def _post_init(self):
+        self._auto_scaling()
+        load_anchor_from_disk()
+        self._load_prefs()
+        self._fit_to_screen()
 
     def _graph_palette(self) -> tuple[str, str, str, str, str, float]:
         t = current_plot_theme()
-        line = t.curve or BADGE_READY_FG
-        face = t.surface or CARD
-        grid = t.grid or BORDER
-        text = t.text_muted or SUBTEXT
+        line = t.curve or theme.BADGE_READY_FG
+        face = t.surface or theme.CARD
+        grid = t.grid or theme.BORDER
+        text = t.text_muted or theme.SUBTEXT
         fill = t.curve_fill or line
         alpha = float(t.curve_fill_alpha)
         return line, face, grid, text, fill, alpha
 
-    def _update_theme_palette(self):
-        from . import theme as theme_constants
-        colors = self.theme.colors
-        blend = self._blend_colors
-        tint = lambda base, color, ratio: blend(base, color, ratio)
-        lighten = lambda c, amount: blend(c, "#FFFFFF", amount)
-        darken = lambda c, amount: blend(c, "#000000", amount)
-        secondary = blend(colors["panel"], colors["surface"], 0.5)
-        track = blend(colors["panel"], colors["bg"], 0.5)
-        is_dark = bool(colors.get("is_dark", False))
-        accent_hover = lighten(colors["accent"], 0.2) if is_dark else darken(colors["accent"], 0.2)
-        secondary_hover_target = colors["surface"] if is_dark else colors["bg"]
-
-        if is_dark:
-            accent_soft = tint(colors["surface"], colors["accent"], 0.18)
-            accent_soft_hover = tint(colors["surface"], colors["accent"], 0.28)
-            warn_soft = tint(colors["surface"], colors["warn"], 0.24)
-            warn_soft_hover = tint(colors["surface"], colors["warn"], 0.34)
-            success_soft = tint(colors["surface"], colors["success"], 0.26)
-            success_soft_hover = tint(colors["surface"], colors["success"], 0.36)
-            neutral_soft = tint(colors["surface"], secondary, 0.4)
-            disabled_bg = tint(colors["surface"], colors["bg"], 0.55)
-            disabled_fg = tint(colors["fg_muted"], colors["bg"], 0.45)
-            hero_bg = tint(colors["surface"], colors["accent"], 0.16)
-            hero_detail_fg = tint(colors["fg_muted"], hero_bg, 0.35)
-            tooltip_bg = tint(colors["surface"], colors["fg"], 0.6)
-            tooltip_fg = colors["fg"]
-            accent_soft_fg = colors["accent"]
-            badge_ready_fg = colors["success"]
-            badge_idle_fg = colors["fg"]
-        else:
-            accent_soft = tint(colors["bg"], colors["accent"], 0.14)
-            accent_soft_hover = tint(colors["bg"], colors["accent"], 0.24)
-            warn_soft = tint(colors["bg"], colors["warn"], 0.22)
-            warn_soft_hover = tint(colors["bg"], colors["warn"], 0.32)
-            success_soft = tint(colors["bg"], colors["success"], 0.26)
-            success_soft_hover = tint(colors["bg"], colors["success"], 0.36)
-            neutral_soft = tint(colors["bg"], secondary, 0.38)
-            disabled_bg = tint(colors["bg"], colors["panel"], 0.35)
-            disabled_fg = tint(colors["fg_muted"], colors["bg"], 0.65)
-            hero_bg = tint(colors["bg"], colors["accent"], 0.18)
-            hero_detail_fg = tint(colors["fg_muted"], hero_bg, 0.4)
-            tooltip_bg = tint(colors["bg"], colors["accent"], 0.32)
-            tooltip_fg = "#ffffff"
-            accent_soft_fg = colors["accent"]
-            badge_ready_fg = colors["success"]
-            badge_idle_fg = colors["fg_muted"]
-
-        palette = {
-            "BG": colors["bg"],
-            "CARD": colors["surface"],
-            "BORDER": colors["border"],
-            "ACCENT": colors["accent"],
-            "ACCENT_HOVER": accent_hover,
-            "ACCENT_DISABLED": blend(colors["accent"], colors["panel"], 0.7),
-            "SECONDARY": secondary,
-            "SECONDARY_HOVER": blend(secondary, secondary_hover_target, 0.4),
-            "FIELD": colors["surface"],
-            "FIELD_FOCUS": blend(colors["surface"], colors["accent"], 0.18),
-            "TEXT": colors["fg"],
-            "SUBTEXT": colors["fg_muted"],
-            "RED": colors["warn"],
-            "FILL": colors["accent"],
-            "TRACK": track,
-            "GLOW": lighten(colors["accent"], 0.45),
-            "ACCENT_SOFT_BG": accent_soft,
-            "ACCENT_SOFT_BG_HOVER": accent_soft_hover,
-            "ACCENT_SOFT_FG": accent_soft_fg,
-            "WARN_SOFT_BG": warn_soft,
-            "WARN_SOFT_BG_HOVER": warn_soft_hover,
-            "SUCCESS_SOFT_BG": success_soft,
-            "SUCCESS_SOFT_BG_HOVER": success_soft_hover,
-            "NEUTRAL_SOFT_BG": neutral_soft,
-            "DISABLED_BG": disabled_bg,
-            "DISABLED_FG": disabled_fg,
-            "MONO_FG": blend(colors["fg"], colors["accent"], 0.35),
-            "HERO_BG": hero_bg,
-            "HERO_DETAIL_FG": hero_detail_fg,
-            "TOOLTIP_BG": tooltip_bg,
-            "TOOLTIP_FG": tooltip_fg,
-            "BADGE_READY_BG": success_soft,
-            "BADGE_READY_FG": badge_ready_fg,
-            "BADGE_NEUTRAL_BG": neutral_soft,
-            "BADGE_IDLE_FG": badge_idle_fg,
-
-            # <<< ICI : jauni les "trous"
-            "HOLE": "#FACC15",         # jaune (500) -- rempli sur la partie pass?e
-            "HOLE_BORDER": "#A16207",  # jaune fonc? -- liser? sur la partie future
-        }
+    def _update_theme_palette(self) -> bool:
+        palette = _PALETTE_CACHE.get(self.theme.current)
+        if palette is None:
+            palette = _build_palette(self.theme.colors)
+        if palette == getattr(self, "_palette", None):
+            return False
         self._palette = palette
-        module_globals = globals()
-        for key, value in palette.items():
-            setattr(theme_constants, key, value)
-            if key in module_globals:
-                module_globals[key] = value
+        self.__dict__.update(palette)
+        vars(theme).update(palette)
+        return True
 
     def _refresh_graphbars_theme(self):
         if not getattr(self, "graph_bars", None):
@@ -336,7 +489,6 @@ class FourApp(tk.Tk):
 
         if self.product_curve_widget:
             self.product_curve_widget.set_geometry(cleaned_sections)
-        self._curve_last_tick = None
 
     def _update_curve_speeds(self) -> None:
         if not self.product_curve_widget:
@@ -346,17 +498,23 @@ class FourApp(tk.Tk):
             self.product_curve_widget.set_speeds(speeds_mps)
         except Exception:
             pass
-    def _sync_theme_attributes(self):
-        palette = getattr(self, "_palette", {})
-        for key, value in palette.items():
-            setattr(self, key, value)
+    def _refresh_segment_constants(self) -> None:
+        self.seg_dur_ms = [int(round(value * 1000.0)) for value in self.seg_durations]
+        self.seg_start_ms = list(accumulate(self.seg_dur_ms, initial=0))
+        self.seg_minutes = tuple(value / 60.0 for value in self.seg_durations)
+        self.seg_texts = [_BarTexts.build(d, v) for d, v in zip(self.seg_durations, self.seg_speeds)]
 
     def _apply_option_defaults(self):
-        self.option_add("*TButton.Cursor", "hand2")
-        self.option_add("*TRadiobutton.Cursor", "hand2")
-        self.option_add("*Entry.insertBackground", TEXT)
-        self.option_add("*Entry.selectBackground", ACCENT)
-        self.option_add("*Entry.selectForeground", "#ffffff")
+        options = (
+            ("*TButton.Cursor", "hand2"),
+            ("*TRadiobutton.Cursor", "hand2"),
+            ("*Entry.insertBackground", theme.TEXT),
+            ("*Entry.selectBackground", theme.ACCENT),
+            ("*Entry.selectForeground", "#ffffff"),
+        )
+        call = self.tk.call
+        for pattern, value in options:
+            call("option", "add", pattern, value)
 
     def on_toggle_theme(self):
         self.theme.toggle(THEME_SEQUENCE)
@@ -366,14 +524,14 @@ class FourApp(tk.Tk):
             pass
 
     def refresh_after_theme_change(self):
-        self._update_theme_palette()
-        self._sync_theme_attributes()
-        self.configure(bg=BG)
+        if not self._update_theme_palette():
+            return
+        self.configure(bg=theme.BG)
         self._init_styles()
         self._apply_option_defaults()
-        for wrapper, _inner in self._cards:
+        for wrapper, _inner in self._live_cards():
             try:
-                wrapper.configure(bg=BORDER, highlightbackground=BORDER, highlightcolor=BORDER)
+                wrapper.configure(bg=theme.BORDER, highlightbackground=theme.BORDER, highlightcolor=theme.BORDER)
             except Exception:
                 pass
         body = getattr(self, "body_frame", None)
@@ -387,23 +545,21 @@ class FourApp(tk.Tk):
                 if hasattr(bar, "refresh_theme"):
                     bar.refresh_theme()
                 else:
-                    bar.configure(bg=CARD)
+                    bar.configure(bg=theme.CARD)
                     bar.redraw()
             except Exception:
                 pass
         self._refresh_graphbars_theme()
-        for window in self.winfo_children():
-            if isinstance(window, tk.Toplevel):
-                try:
-                    window.configure(bg=BG)
-                except Exception:
-                    pass
-                for child in window.winfo_children():
-                    if isinstance(child, scrolledtext.ScrolledText):
-                        try:
-                            child.configure(bg=CARD, fg=TEXT, insertbackground=TEXT)
-                        except Exception:
-                            pass
+        for window in list(self._themed_windows):
+            try:
+                window.configure(bg=theme.BG)
+            except Exception:
+                pass
+        for text in list(self._themed_texts):
+            try:
+                text.configure(bg=theme.CARD, fg=theme.TEXT, insertbackground=theme.TEXT)
+            except Exception:
+                pass
         if hasattr(self, "details") and isinstance(self.details, Collapsible):
             try:
                 self.details.configure(style="CardInner.TFrame")
@@ -416,6 +572,9 @@ class FourApp(tk.Tk):
                 pass
 
     def _fit_to_screen(self, margin=60):
+        self.after_idle(self._do_fit, margin)
+
+    def _do_fit(self, margin):
         self.update_idletasks()
         req_w, req_h = self.winfo_reqwidth(), self.winfo_reqheight()
         scr_w, scr_h = self.winfo_screenwidth(), self.winfo_screenheight()
@@ -437,33 +596,50 @@ class FourApp(tk.Tk):
             pass
 
     def _clear_toasts(self):
-        for tip in list(self._toasts):
+        for entry in list(self._toasts):
             try:
-                tip.destroy()
+                entry[0].after_cancel(entry[0]._hide_after)
             except Exception:
                 pass
-        self._toasts.clear()
+            self._release_toast(entry)
 
-    def toast(self, message: str, ms=2000):
+    def _new_toast(self) -> tuple[tk.Toplevel, tk.Label]:
         tip = tk.Toplevel(self)
+        tip.withdraw()
         tip.overrideredirect(True)
         tip.configure(bg="#000000")
         try:
             tip.attributes("-alpha", 0.9)
         except Exception:
             pass
-        lbl = tk.Label(tip, text=message, bg="#000000", fg="#ffffff", font=("Segoe UI", 10), padx=12, pady=6)
+        lbl = tk.Label(tip, bg="#000000", fg="#ffffff", font="AppSmall", padx=12, pady=6)
         lbl.pack()
-        tip.update_idletasks()
+        return tip, lbl
+
+    def _release_toast(self, entry):
+        if entry in self._toasts:
+            self._toasts.remove(entry)
+        tip = entry[0]
+        try:
+            tip.withdraw()
+        except tk.TclError:
+            return
+        if len(self._toast_pool) < 4:
+            self._toast_pool.append(entry)
+        else:
+            tip.destroy()
+
+    def toast(self, message: str, ms=2000):
+        entry = self._toast_pool.pop() if self._toast_pool else self._new_toast()
+        tip, lbl = entry
+        self._set_label(lbl, message)
         x = self.winfo_rootx() + 40
         y = self.winfo_rooty() + 20
         tip.geometry(f"+{x}+{y}")
-        tip.after(ms, tip.destroy)
-        def _cleanup(_=None):
-            if tip in self._toasts:
-                self._toasts.remove(tip)
-        tip.bind("<Destroy>", _cleanup)
-        self._toasts.append(tip)
+        tip.deiconify()
+        tip.lift()
+        tip._hide_after = tip.after(ms, self._release_toast, entry)
+        self._toasts.append(entry)
 
     def _clear_error(self):
         if self._error_after is not None:
@@ -473,13 +649,13 @@ class FourApp(tk.Tk):
                 pass
             self._error_after = None
         if hasattr(self, "err_box"):
-            self.err_box.config(text="")
+            self._set_label(self.err_box, "")
 
     def _show_error(self, msg):
         if not hasattr(self, "err_box"):
             return
         self._clear_error()
-        self.err_box.config(text=f"⚠ {msg}")
+        self._set_label(self.err_box, f"⚠ {msg}")
         self._error_after = self.after(4000, self._clear_error)
         try:
             self.bell()
@@ -487,17 +663,13 @@ class FourApp(tk.Tk):
             pass
 
     def _validate_num(self, s: str) -> bool:
-        if s in ("", "."):
+        if not s or _NUM_MATCH(s) is not None:
             return True
         try:
-            float(s.replace(",", "."))
-            return True
-        except ValueError:
-            try:
-                self.bell()
-            except Exception:
-                pass
-            return False
+            self.bell()
+        except Exception:
+            pass
+        return False
 
     def _set_default_inputs(self):
         for widget, value in zip((self.e1, self.e2, self.e3), DEFAULT_INPUTS):
@@ -507,21 +679,16 @@ class FourApp(tk.Tk):
     def _save_prefs(self):
         data = dict(
             geom=self.winfo_geometry(),
-            f1=self.e1.get(),
-            f2=self.e2.get(),
-            f3=self.e3.get(),
+            f1=self.v1.get(),
+            f2=self.v2.get(),
+            f3=self.v3.get(),
             compact=self.compact_mode,
         )
-        try:
-            PREFS_PATH.write_text(json.dumps(data), encoding="utf-8")
-        except Exception:
-            pass
+        threading.Thread(target=_write_prefs, args=(_dump_prefs(data),), name="prefs-writer").start()
 
     def _load_prefs(self):
-        if not PREFS_PATH.exists():
-            return
         try:
-            data = json.loads(PREFS_PATH.read_text(encoding="utf-8"))
+            data = _parse_prefs(PREFS_PATH.read_bytes())
         except Exception:
             return
         self.e1.delete(0, tk.END)
@@ -543,20 +710,19 @@ class FourApp(tk.Tk):
 
     def set_density(self, compact: bool):
         compact = bool(compact)
+        if compact == self.compact_mode:
+            return
         self.compact_mode = compact
-        pad = (12, 8) if compact else (20, 16)
-        hero_value_size = 20 if compact else 22
-        card_heading_size = 13 if compact else 14
-        self.style.configure("CardHeading.TLabel", font=("Segoe UI Semibold", card_heading_size))
-        self.style.configure("HeroStatValue.TLabel", font=("Segoe UI", hero_value_size, "bold"))
-        self.style.configure("HeroStatLabel.TLabel", font=("Segoe UI Semibold", 9 if compact else 10))
-        for wrapper, inner in self._cards:
+        pad, font_sizes, button_text = _DENSITY[compact]
+        for name, size in font_sizes.items():
+            self._fonts[name].configure(size=size)
+        for _wrapper, inner in self._live_cards():
             try:
                 inner.configure(padding=pad)
             except Exception:
                 pass
         if hasattr(self, "density_button"):
-            self.density_button.config(text="Mode confortable" if compact else "Mode compact")
+            self._set_label(self.density_button, button_text)
 
     def _cancel_after(self):
         if getattr(self, "_after_id", None):
@@ -566,198 +732,302 @@ class FourApp(tk.Tk):
                 pass
             self._after_id = None
 
-    def _schedule_tick(self):
+    def _cancel_notifications(self):
+        if self._notify_after_id:
+            try:
+                self.after_cancel(self._notify_after_id)
+            except Exception:
+                pass
+            self._notify_after_id = None
+
+    def _schedule_notifications(self):
+        self._cancel_notifications()
+        if self.notified_exit or self.total_duration <= 5 * 60:
+            return
+        elapsed_ms = self.seg_start_ms[self.seg_idx] + self.seg_elapsed_ms
+        delay = self.seg_start_ms[-1] - 5 * 60 * 1000 - elapsed_ms
+        self._notify_after_id = self.after(max(0, delay), self._notify_exit)
+
+    def _notify_exit(self):
+        self._notify_after_id = None
+        if not self.animating or self.paused:
+            return
+        self.notified_exit = True
+        self.toast("Le produit va sortir du four (≤ 5 min)")
+
+    def _update_tick_interval(self):
+        i = self.seg_idx
+        interval = TICK_SECONDS
+        if 0 <= i < len(self.bars):
+            width = self.bars[i].winfo_width()
+            self._bar_px = width if width > 1 else 1000
+            if width > 1:
+                interval = self.seg_durations[i] / width
+        interval = max(TICK_MIN_SECONDS, min(TICK_SECONDS, interval))
+        self._tick_ms = int(interval * 1000)
+
+    def _on_bar_configure(self, index, event):
+        if index == self.seg_idx and event.width > 1 and event.width != self._bar_px:
+            self._update_tick_interval()
+            self._progress_px = None
+
+    def _schedule_tick(self, now):
         self._cancel_after()
-        self._after_id = self.after(int(TICK_SECONDS * 1000), self._tick)
+        target = self._tick_ms
+        if self._iconic:
+            target = max(target, int(TICK_ICONIC_SECONDS * 1000))
+        overhead = sum(self._tick_overheads) / len(self._tick_overheads) if self._tick_overheads else 0.0
+        delay = max(1, target - int(overhead))
+        self._tick_delay_ms = delay
+        self._tick_sched_at = now
+        self._after_id = self.after(delay, self._tick)
+
+    def _on_map_change(self, event):
+        if event.widget is self:
+            self._iconic = event.type == tk.EventType.Unmap
+
+    def _reset_tick_timing(self):
+        self._tick_sched_at = None
+        self._tick_delay_ms = 0
+        self._tick_overheads.clear()
+
+    def _init_fonts(self):
+        existing = set(tkfont.names(self))
+        for name, (family, size, *flags) in _NAMED_FONTS.items():
+            if name in existing:
+                self._fonts[name] = tkfont.Font(self, name=name, exists=True)
+                continue
+            self._fonts[name] = tkfont.Font(
+                self,
+                name=name,
+                family=family,
+                size=size,
+                weight="bold" if "bold" in flags else "normal",
+                slant="italic" if "italic" in flags else "roman",
+            )
 
     def _init_styles(self):
-        style = self.theme.style
-        base_font = ("Segoe UI", 11)
-        style.configure("TFrame", background=BG)
-        style.configure("Card.TFrame", background=CARD)
-        style.configure("CardInner.TFrame", background=CARD)
-        style.configure("TLabel", background=BG, foreground=TEXT, font=base_font)
-        style.configure("Card.TLabel", background=CARD, foreground=TEXT, font=base_font)
-        style.configure("Title.TLabel", background=CARD, foreground=ACCENT, font=("Segoe UI Semibold", 17))
-        style.configure("HeroTitle.TLabel", background=CARD, foreground=ACCENT, font=("Segoe UI Semibold", 18))
-        style.configure("HeroSub.TLabel", background=CARD, foreground=SUBTEXT, font=("Segoe UI", 11))
-        style.configure("CardHeading.TLabel", background=CARD, foreground=ACCENT, font=("Segoe UI Semibold", 14))
-        style.configure("Subtle.TLabel", background=CARD, foreground=SUBTEXT, font=("Segoe UI", 10))
-        style.configure("Hint.TLabel", background=CARD, foreground=SUBTEXT, font=("Segoe UI", 10, "italic"))
-        style.configure("TableHead.TLabel", background=CARD, foreground=SUBTEXT, font=("Segoe UI Semibold", 11))
-        style.configure("Big.TLabel", background=CARD, foreground=TEXT, font=("Segoe UI", 20, "bold"))
-        style.configure("Result.TLabel", background=CARD, foreground=ACCENT, font=("Segoe UI", 22, "bold"))
-        style.configure("Mono.TLabel", background=CARD, foreground=MONO_FG, font=("Consolas", 11))
-        style.configure("Status.TLabel", background=CARD, foreground=SUBTEXT, font=("Consolas", 11))
-        style.configure("Footer.TLabel", background=BG, foreground=SUBTEXT, font=("Segoe UI", 10))
-        style.configure("Dark.TSeparator", background=BORDER)
-        style.configure("TSeparator", background=BORDER)
-        style.configure("StatCard.TFrame", background=SECONDARY, relief="flat")
-        style.configure("StatTitle.TLabel", background=SECONDARY, foreground=SUBTEXT, font=("Segoe UI Semibold", 10))
-        style.configure("StatValue.TLabel", background=SECONDARY, foreground=TEXT, font=("Segoe UI", 18, "bold"))
-        style.configure("StatDetail.TLabel", background=SECONDARY, foreground=SUBTEXT, font=("Consolas", 11))
-        style.configure("ParamName.TLabel", background=CARD, foreground=SUBTEXT, font=("Segoe UI Semibold", 10))
-        style.configure("ParamValue.TLabel", background=CARD, foreground=TEXT, font=("Consolas", 11))
-        style.configure("HeroStat.TFrame", background=HERO_BG, relief="flat")
-        style.configure("HeroStatValue.TLabel", background=HERO_BG, foreground=ACCENT, font=("Segoe UI", 22, "bold"))
-        style.configure("HeroStatLabel.TLabel", background=HERO_BG, foreground=SUBTEXT, font=("Segoe UI Semibold", 10))
-        style.configure("HeroStatDetail.TLabel", background=HERO_BG, foreground=HERO_DETAIL_FG, font=("Segoe UI", 10))
-        style.configure("Logo.TLabel", background=CARD)
-        style.configure("StageRow.TFrame", background=CARD)
-        style.configure("StageTitle.TLabel", background=CARD, foreground=TEXT, font=("Segoe UI Semibold", 12))
-        style.configure("StageFreq.TLabel", background=CARD, foreground=SUBTEXT, font=("Consolas", 11))
-        style.configure("StageTime.TLabel", background=CARD, foreground=ACCENT, font=("Segoe UI Semibold", 18))
-        style.configure("StageTimeDetail.TLabel", background=CARD, foreground=SUBTEXT, font=("Segoe UI", 10))
-        style.configure(
-            "Accent.TButton",
-            background=ACCENT,
-            foreground="#ffffff",
-            padding=10,
-            borderwidth=0,
-            focusthickness=0,
-            relief="flat",
-            font=("Segoe UI", 11, "bold"),
-        )
-        style.map(
-            "Accent.TButton",
-            background=[("active", ACCENT_HOVER), ("disabled", ACCENT_DISABLED)],
-            foreground=[("disabled", DISABLED_FG)],
-        )
-        style.configure(
-            "Ghost.TButton",
-            background=SECONDARY,
-            foreground=TEXT,
-            padding=10,
-            borderwidth=0,
-            focusthickness=0,
-            relief="flat",
-            font=("Segoe UI", 11, "bold"),
-        )
-        style.map(
-            "Ghost.TButton",
-            background=[("active", SECONDARY_HOVER), ("disabled", DISABLED_BG)],
-            foreground=[("disabled", DISABLED_FG)],
-        )
-        style.configure(
-            "Chip.TButton",
-            background=ACCENT_SOFT_BG,
-            foreground=ACCENT_SOFT_FG,
-            padding=(12, 6),
-            borderwidth=0,
-            focusthickness=0,
-            relief="flat",
-            font=("Segoe UI Semibold", 10),
-        )
-        style.map(
-            "Chip.TButton",
-            background=[("active", ACCENT_SOFT_BG_HOVER), ("disabled", DISABLED_BG)],
-            foreground=[("disabled", DISABLED_FG)],
-        )
-        style.configure(
-            "Dark.TEntry",
-            fieldbackground=FIELD,
-            background=FIELD,
-            foreground=TEXT,
-            bordercolor=BORDER,
-            insertcolor=TEXT,
-        )
-        style.map(
-            "Dark.TEntry",
-            fieldbackground=[("focus", FIELD_FOCUS)],
-            bordercolor=[("focus", ACCENT)],
-            foreground=[("disabled", SUBTEXT)],
-        )
-        style.configure(
-            "Dark.TSpinbox",
-            fieldbackground=FIELD,
-            background=FIELD,
-            foreground=TEXT,
-            arrowsize=12,
-            bordercolor=BORDER,
-            insertcolor=TEXT,
-        )
-        style.map(
-            "Dark.TSpinbox",
-            fieldbackground=[("focus", FIELD_FOCUS)],
-            bordercolor=[("focus", ACCENT)],
-            foreground=[("disabled", SUBTEXT)],
-        )
-        style.configure(
-            "Accent.TRadiobutton",
-            background=CARD,
-            foreground=TEXT,
-            indicatorcolor=BORDER,
-            focuscolor=ACCENT,
-            padding=4,
-            font=base_font,
-        )
-        style.map(
-            "Accent.TRadiobutton",
-            indicatorcolor=[("selected", ACCENT), ("!selected", BORDER)],
-            foreground=[("disabled", DISABLED_FG)],
-        )
-        badge_font = ("Segoe UI Semibold", 10)
-        style.configure("BadgeIdle.TLabel", background=SECONDARY, foreground=BADGE_IDLE_FG, font=badge_font, padding=(10, 2))
-        style.configure("BadgeReady.TLabel", background=BADGE_READY_BG, foreground=BADGE_READY_FG, font=badge_font, padding=(10, 2))
-        style.configure("BadgeActive.TLabel", background=ACCENT, foreground="#ffffff", font=badge_font, padding=(10, 2))
-        style.configure("BadgeDone.TLabel", background=ACCENT_HOVER, foreground="#ffffff", font=badge_font, padding=(10, 2))
-        style.configure("BadgePause.TLabel", background=ACCENT_DISABLED, foreground=TEXT, font=badge_font, padding=(10, 2))
-        style.configure("BadgeNeutral.TLabel", background=BADGE_NEUTRAL_BG, foreground=TEXT, font=badge_font, padding=(10, 2))
-        self.style = style
+        calls = self._style_calls.get(self.theme.current)
+        if calls is None:
+            calls = self._style_calls[self.theme.current] = self._style_commands()
+        call = self.tk.call
+        for args in calls:
+            call(*args)
+        self.style = self.theme.style
+
+    @classmethod
+    def _style_commands(cls) -> list[tuple]:
+        commands = []
+        for name, spec in cls._style_settings().items():
+            for verb, options in spec.items():
+                args = ["ttk::style", verb, name]
+                for key, value in options.items():
+                    if verb == "map":
+                        value = tuple(item for statespec in value for item in statespec)
+                    args += ("-" + key, value)
+                commands.append(tuple(args))
+        return commands
+
+    @staticmethod
+    def _style_settings() -> dict[str, dict]:
+        button = dict(padding=10, borderwidth=0, focusthickness=0, relief="flat", font="AppButton")
+        field_map = {
+            "fieldbackground": [("focus", theme.FIELD_FOCUS)],
+            "bordercolor": [("focus", theme.ACCENT)],
+            "foreground": [("disabled", theme.SUBTEXT)],
+        }
+        conf = {
+            "TFrame": dict(background=theme.BG),
+            "Card.TFrame": dict(background=theme.CARD),
+            "CardInner.TFrame": dict(background=theme.CARD),
+            "TLabel": dict(background=theme.BG, foreground=theme.TEXT, font="AppBody"),
+            "Card.TLabel": dict(background=theme.CARD, foreground=theme.TEXT, font="AppBody"),
+            "Title.TLabel": dict(background=theme.CARD, foreground=theme.ACCENT, font="AppTitle"),
+            "HeroTitle.TLabel": dict(background=theme.CARD, foreground=theme.ACCENT, font="AppHeading"),
+            "HeroSub.TLabel": dict(background=theme.CARD, foreground=theme.SUBTEXT, font="AppBody"),
+            "CardHeading.TLabel": dict(background=theme.CARD, foreground=theme.ACCENT, font="AppCardHeading"),
+            "Subtle.TLabel": dict(background=theme.CARD, foreground=theme.SUBTEXT, font="AppSmall"),
+            "Hint.TLabel": dict(background=theme.CARD, foreground=theme.SUBTEXT, font="AppHint"),
+            "TableHead.TLabel": dict(background=theme.CARD, foreground=theme.SUBTEXT, font="AppBodyStrong"),
+            "Big.TLabel": dict(background=theme.CARD, foreground=theme.TEXT, font="AppBig"),
+            "Result.TLabel": dict(background=theme.CARD, foreground=theme.ACCENT, font="AppResult"),
+            "Mono.TLabel": dict(background=theme.CARD, foreground=theme.MONO_FG, font="AppMono"),
+            "Status.TLabel": dict(background=theme.CARD, foreground=theme.SUBTEXT, font="AppMono"),
+            "Footer.TLabel": dict(background=theme.BG, foreground=theme.SUBTEXT, font="AppSmall"),
+            "Dark.TSeparator": dict(background=theme.BORDER),
+            "TSeparator": dict(background=theme.BORDER),
+            "HeroStat.TFrame": dict(background=theme.HERO_BG, relief="flat"),
+            "HeroStatValue.TLabel": dict(background=theme.HERO_BG, foreground=theme.ACCENT, font="AppHeroValue"),
+            "HeroStatLabel.TLabel": dict(background=theme.HERO_BG, foreground=theme.SUBTEXT, font="AppHeroLabel"),
+            "HeroStatDetail.TLabel": dict(background=theme.HERO_BG, foreground=theme.HERO_DETAIL_FG, font="AppSmall"),
+            "Logo.TLabel": dict(background=theme.CARD),
+            "StageTitle.TLabel": dict(background=theme.CARD, foreground=theme.TEXT, font="AppStageTitle"),
+            "StageFreq.TLabel": dict(background=theme.CARD, foreground=theme.SUBTEXT, font="AppMono"),
+            "StageTime.TLabel": dict(background=theme.CARD, foreground=theme.ACCENT, font="AppHeading"),
+            "StageTimeDetail.TLabel": dict(background=theme.CARD, foreground=theme.SUBTEXT, font="AppSmall"),
+            "Accent.TButton": dict(background=theme.ACCENT, foreground="#ffffff", **button),
+            "Ghost.TButton": dict(background=theme.SECONDARY, foreground=theme.TEXT, **button),
+            "Chip.TButton": dict(
+                background=theme.ACCENT_SOFT_BG,
+                foreground=theme.ACCENT_SOFT_FG,
+                padding=(12, 6),
+                borderwidth=0,
+                focusthickness=0,
+                relief="flat",
+                font="AppCaption",
+            ),
+            "Dark.TEntry": dict(fieldbackground=theme.FIELD, background=theme.FIELD, foreground=theme.TEXT, bordercolor=theme.BORDER, insertcolor=theme.TEXT),
+            "Dark.TSpinbox": dict(
+                fieldbackground=theme.FIELD,
+                background=theme.FIELD,
+                foreground=theme.TEXT,
+                arrowsize=12,
+                bordercolor=theme.BORDER,
+                insertcolor=theme.TEXT,
+            ),
+            "Accent.TRadiobutton": dict(
+                background=theme.CARD,
+                foreground=theme.TEXT,
+                indicatorcolor=theme.BORDER,
+                focuscolor=theme.ACCENT,
+                padding=4,
+                font="AppBody",
+            ),
+            "BadgeIdle.TLabel": dict(background=theme.SECONDARY, foreground=theme.BADGE_IDLE_FG, font="AppCaption", padding=(10, 2)),
+            "BadgeReady.TLabel": dict(background=theme.BADGE_READY_BG, foreground=theme.BADGE_READY_FG, font="AppCaption", padding=(10, 2)),
+            "BadgeActive.TLabel": dict(background=theme.ACCENT, foreground="#ffffff", font="AppCaption", padding=(10, 2)),
+            "BadgeDone.TLabel": dict(background=theme.ACCENT_HOVER, foreground="#ffffff", font="AppCaption", padding=(10, 2)),
+            "BadgePause.TLabel": dict(background=theme.ACCENT_DISABLED, foreground=theme.TEXT, font="AppCaption", padding=(10, 2)),
+            "BadgeNeutral.TLabel": dict(background=theme.BADGE_NEUTRAL_BG, foreground=theme.TEXT, font="AppCaption", padding=(10, 2)),
+        }
+        maps = {
+            "Accent.TButton": {
+                "background": [("active", theme.ACCENT_HOVER), ("disabled", theme.ACCENT_DISABLED)],
+                "foreground": [("disabled", theme.DISABLED_FG)],
+            },
+            "Ghost.TButton": {
+                "background": [("active", theme.SECONDARY_HOVER), ("disabled", theme.DISABLED_BG)],
+                "foreground": [("disabled", theme.DISABLED_FG)],
+            },
+            "Chip.TButton": {
+                "background": [("active", theme.ACCENT_SOFT_BG_HOVER), ("disabled", theme.DISABLED_BG)],
+                "foreground": [("disabled", theme.DISABLED_FG)],
+            },
+            "Dark.TEntry": field_map,
+            "Dark.TSpinbox": field_map,
+            "Accent.TRadiobutton": {
+                "indicatorcolor": [("selected", theme.ACCENT), ("!selected", theme.BORDER)],
+                "foreground": [("disabled", theme.DISABLED_FG)],
+            },
+        }
+        settings = {}
+        for name, opts in conf.items():
+            settings[name] = {"configure": opts}
+            if name in maps:
+                settings[name]["map"] = maps[name]
+        return settings
 
     def _load_logo(self):
-        path = Path(__file__).with_name("rochias.png")
-        if not path.exists():
-            return
+        path = Path(__file__).with_name("rochias_header.png")
         try:
-            img = tk.PhotoImage(file=str(path))
+            self.logo_img = tk.PhotoImage(file=str(path))
         except tk.TclError:
-            return
-        max_height = 72
-        max_width = 260
-        height = img.height()
-        width = img.width()
-        if height > max_height:
-            factor = max(1, int(math.ceil(height / max_height)))
-            img = img.subsample(factor, factor)
-            height = img.height()
-            width = img.width()
-        if width > max_width:
-            factor = max(1, int(math.ceil(width / max_width)))
-            img = img.subsample(factor, factor)
-        self.logo_img = img
+            self.logo_img = None
 
     def _card(self, parent, *, padding=(20, 16), **pack_kwargs):
-        wrapper = tk.Frame(parent, bg=BORDER, highlightbackground=BORDER, highlightcolor=BORDER, highlightthickness=1, bd=0)
+        wrapper = tk.Frame(parent, bg=theme.BORDER, highlightbackground=theme.BORDER, highlightcolor=theme.BORDER, highlightthickness=1, bd=0)
         inner = ttk.Frame(wrapper, style="Card.TFrame", padding=padding)
         inner.pack(fill="both", expand=True)
         wrapper.pack(**pack_kwargs)
-        self._cards.append((wrapper, inner))
+        self._cards.append((weakref.ref(wrapper), weakref.ref(inner)))
         return inner
 
-    def _create_stat_card(self, parent, column, title, *, frame_style="StatCard.TFrame", title_style="StatTitle.TLabel", value_style="StatValue.TLabel", detail_style="StatDetail.TLabel"):
-        frame = ttk.Frame(parent, style=frame_style, padding=(16, 12))
+    def _live_cards(self) -> list[tuple[tk.Frame, ttk.Frame]]:
+        live = []
+        for wrapper_ref, inner_ref in self._cards:
+            wrapper, inner = wrapper_ref(), inner_ref()
+            if wrapper is not None and inner is not None:
+                live.append((wrapper, inner))
+        if len(live) != len(self._cards):
+            self._cards = [(weakref.ref(w), weakref.ref(i)) for w, i in live]
+        return live
+
+    @staticmethod
+    def _create_stat_card(parent, column, title):
+        frame = ttk.Frame(parent, style="HeroStat.TFrame", padding=(16, 12))
         frame.grid(row=0, column=column, sticky="nsew", padx=(0 if column == 0 else 12, 0))
-        ttk.Label(frame, text=title, style=title_style).pack(anchor="w")
-        value = ttk.Label(frame, text="--", style=value_style)
+        ttk.Label(frame, text=title, style="HeroStatLabel.TLabel").pack(anchor="w")
+        value = ttk.Label(frame, text="--", style="HeroStatValue.TLabel")
         value.pack(anchor="w", pady=(4, 2))
-        detail = ttk.Label(frame, text="--", style=detail_style)
+        detail = ttk.Label(frame, text="--", style="HeroStatDetail.TLabel")
         detail.pack(anchor="w")
-        parent.columnconfigure(column, weight=1, uniform="stat")
         return value, detail
 
-    def _update_kpi(self, key, main_text, detail_text="--"):
-        labels = self.kpi_labels.get(key)
+    def _on_resize_wrapping(self, event):
+        self._wrap_width = event.width
+        if self._wrap_after is None:
+            self._wrap_after = self.after_idle(self._apply_wraplength)
+
+    def _apply_wraplength(self):
+        self._wrap_after = None
+        wrap = max(200, int(self._wrap_width * 0.85))
+        if wrap == self._wrap_applied:
+            return
+        self._wrap_applied = wrap
+        call = self.tk.call
+        for lbl in self._responsive_labels:
+            call(str(lbl), "configure", "-wraplength", wrap)
+
+    @contextmanager
+    def _batch_updates(self, idle=True):
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                pending, self._pending_text = self._pending_text, {}
+                for widget, text in pending.items():
+                    self._set_label(widget, text)
+                if idle:
+                    self.update_idletasks()
+
+    def _set_label(self, widget, text: str) -> None:
+        if self._batch_depth:
+            self._pending_text[widget] = text
+            return
+        if getattr(widget, "_cached_text", None) == text:
+            return
+        self.tk.call(str(widget), "configure", "-text", text)
+        widget._cached_text = text
+
+    def _set_badge(self, widget, text: str, style: str) -> None:
+        if getattr(widget, "_cached_badge", None) == (text, style):
+            return
+        self.tk.call(str(widget), "configure", "-text", text, "-style", style)
+        widget._cached_badge = (text, style)
+
+    def _update_kpi(self, labels, main_text, detail_text="--"):
         if not labels:
             return
         value_lbl, detail_lbl = labels
-        value_lbl.config(text=main_text)
-        detail_lbl.config(text=detail_text)
+        self._set_label(value_lbl, main_text)
+        self._set_label(detail_lbl, detail_text)
+
+    def _update_kpis(self, texts) -> None:
+        with self._batch_updates(idle=False):
+            for (value_lbl, detail_lbl), (main_text, detail_text) in zip(self.kpi_belts, texts):
+                self._set_label(value_lbl, main_text)
+                self._set_label(detail_lbl, detail_text)
+
+    def _reset_kpis(self):
+        self._update_kpi(self.kpi_total, "--", "--")
+        self._update_kpis(_KPI_EMPTY)
 
     def _build_ui(self):
         header = self._card(self, fill="x", padx=18, pady=(16, 8), padding=(28, 22))
         header.columnconfigure(0, weight=1)
-        accent = tk.Frame(header, background=ACCENT, height=4)
+        accent = tk.Frame(header, background=theme.ACCENT, height=4)
         accent.grid(row=0, column=0, sticky="ew", pady=(0, 16))
         header.grid_rowconfigure(0, weight=0)
         header.grid_rowconfigure(1, weight=1)
@@ -779,17 +1049,9 @@ class FourApp(tk.Tk):
         hero_stats = ttk.Frame(hero, style="CardInner.TFrame")
         hero_stats.grid(row=3, column=0, columnspan=3, sticky="ew", pady=(18, 0))
         hero_stats.columnconfigure((0, 1, 2, 3), weight=1, uniform="hero")
-        kpi_defs = [("total", "Temps total"), ("t1", "Tapis 1"), ("t2", "Tapis 2"), ("t3", "Tapis 3")]
-        for idx, (key, label) in enumerate(kpi_defs):
-            pill = ttk.Frame(hero_stats, style="HeroStat.TFrame", padding=(16, 12))
-            pill.grid(row=0, column=idx, sticky="nsew", padx=(0 if idx == 0 else 12, 0))
-            ttk.Label(pill, text=label, style="HeroStatLabel.TLabel").pack(anchor="w")
-            value = ttk.Label(pill, text="--", style="HeroStatValue.TLabel")
-            value.pack(anchor="w", pady=(4, 0))
-            detail = ttk.Label(pill, text="--", style="HeroStatDetail.TLabel")
-            detail.pack(anchor="w", pady=(2, 0))
-            self.kpi_labels[key] = (value, detail)
-        Tooltip(self.kpi_labels["total"][0], "Temps total par la référence maintenance (L/v).")
+        self.kpi_total = self._create_stat_card(hero_stats, 0, _KPI_TITLES[0])
+        self.kpi_belts = [self._create_stat_card(hero_stats, idx, label) for idx, label in enumerate(_KPI_TITLES[1:], 1)]
+        Tooltip(self.kpi_total[0], "Temps total par la référence maintenance (L/v).")
         body = VScrollFrame(self)
         body.pack(fill="both", expand=True)
         self.body_frame = body
@@ -806,21 +1068,23 @@ class FourApp(tk.Tk):
         self.bar_duration_labels = []
         self.stage_status = []
         self.accum_badges = []
+        g_line, g_face, g_grid, g_text, g_fill, g_alpha = self._graph_palette()
         for i in range(3):
             holder = ttk.Frame(pcard, style="CardInner.TFrame")
             holder.pack(fill="x", pady=10)
             setattr(holder, "DISPLAY_Y_MAX_CM", DISPLAY_Y_MAX_CM)
-            setattr(holder, "CURVE_COLOR", BADGE_READY_FG)
+            setattr(holder, "CURVE_COLOR", theme.BADGE_READY_FG)
             title_row = ttk.Frame(holder, style="CardInner.TFrame")
             title_row.pack(fill="x")
             ttk.Label(title_row, text=f"Tapis {i + 1}", style="Card.TLabel").pack(side="left")
             status_lbl = ttk.Label(title_row, text="⏳ En attente", style="BadgeIdle.TLabel")
             status_lbl.pack(side="left", padx=(12, 0))
-            accum_lbl = ttk.Label(title_row, text="", style="BadgeNeutral.TLabel")
             if i > 0:
+                accum_lbl = ttk.Label(title_row, text="", style="BadgeNeutral.TLabel")
                 accum_lbl.pack(side="left", padx=(8, 0))
-            self.accum_badges.append(accum_lbl if i > 0 else None)
-            g_line, g_face, g_grid, g_text, g_fill, g_alpha = self._graph_palette()
+                self.accum_badges.append(accum_lbl)
+            else:
+                self.accum_badges.append(None)
             graph = GraphBar(
                 holder,
                 y_max=DISPLAY_Y_MAX_CM,
@@ -837,7 +1101,8 @@ class FourApp(tk.Tk):
             self.graph_bars.append(graph)
             bar = SegmentedBar(holder, height=30)
             bar.pack(fill="x", expand=True, pady=(8, 4))
-            bar.set_markers([1 / 3, 2 / 3], ["", ""])
+            bar.bind("<Configure>", lambda event, idx=i: self._on_bar_configure(idx, event), add="+")
+            bar.set_markers(_BAR_THIRDS, _BAR_THIRD_LABELS)
             visible_cells = visible_cells_for_tapis(i + 1)
             count_visible = len(visible_cells)
             if count_visible:
@@ -862,19 +1127,20 @@ class FourApp(tk.Tk):
         g = ttk.Frame(card_in, style="CardInner.TFrame")
         g.pack(fill="x", pady=(12, 6))
         g.columnconfigure(1, weight=1)
-        ttk.Label(g, text="Tapis 1 : Hz =", style="Card.TLabel").grid(row=0, column=0, sticky="e", padx=(0, 12), pady=6)
-        vcmd = (self.register(self._validate_num), "%P")
-        self.e1 = ttk.Spinbox(g, from_=1, to=120, increment=0.01, format="%.2f", width=10, style="Dark.TSpinbox", validate="key", validatecommand=vcmd)
-        self.e1.grid(row=0, column=1, sticky="w", pady=6)
-        ttk.Label(g, text="Tapis 2 : Hz =", style="Card.TLabel").grid(row=1, column=0, sticky="e", padx=(0, 12), pady=6)
-        self.e2 = ttk.Spinbox(g, from_=1, to=120, increment=0.01, format="%.2f", width=10, style="Dark.TSpinbox", validate="key", validatecommand=vcmd)
-        self.e2.grid(row=1, column=1, sticky="w", pady=6)
-        ttk.Label(g, text="Tapis 3 : Hz =", style="Card.TLabel").grid(row=2, column=0, sticky="e", padx=(0, 12), pady=6)
-        self.e3 = ttk.Spinbox(g, from_=1, to=120, increment=0.01, format="%.2f", width=10, style="Dark.TSpinbox", validate="key", validatecommand=vcmd)
-        self.e3.grid(row=2, column=1, sticky="w", pady=6)
-        ttk.Label(g, text="Épaisseur entrée h0 (cm) =", style="Card.TLabel").grid(row=3, column=0, sticky="e", padx=(0, 12), pady=6)
-        self.h0 = ttk.Spinbox(g, from_=0.10, to=20.0, increment=0.10, format="%.2f", width=10, style="Dark.TSpinbox", validate="key", validatecommand=vcmd)
-        self.h0.grid(row=3, column=1, sticky="w", pady=6)
+        vcmd = f"{self.register(self._validate_num)} %P"
+        self.v1, self.v2, self.v3 = tk.StringVar(self), tk.StringVar(self), tk.StringVar(self)
+
+        def spin(row, text, **kwargs):
+            ttk.Label(g, text=text, style="Card.TLabel").grid(row=row, column=0, sticky="e", padx=(0, 12), pady=6)
+            box = ttk.Spinbox(g, format="%.2f", width=10, style="Dark.TSpinbox", validate="key", validatecommand=vcmd, **kwargs)
+            box.grid(row=row, column=1, sticky="w", pady=6)
+            return box
+
+        self.e1, self.e2, self.e3 = (
+            spin(row, f"Tapis {row + 1} : Hz =", from_=1, to=120, increment=0.01, textvariable=var)
+            for row, var in enumerate((self.v1, self.v2, self.v3))
+        )
+        self.h0 = spin(3, "Épaisseur entrée h0 (cm) =", from_=0.10, to=20.0, increment=0.10)
         self.h0.delete(0, tk.END)
         self.h0.insert(0, "2.00")
         ttk.Label(card_in, text="Astuce : 40.00 ou 4000 (IHM). >200 = IHM/100.", style="Hint.TLabel").pack(anchor="w", pady=(4, 12))
@@ -904,42 +1170,48 @@ class FourApp(tk.Tk):
         self.btn_feed_stop.grid(row=1, column=0, padx=(0, 12), pady=(8, 2), sticky="w")
         self.btn_feed_resume = ttk.Button(btns, text="✅ Reprise alimentation", command=self.on_feed_resume, state="disabled", style="Ghost.TButton")
         self.btn_feed_resume.grid(row=1, column=1, padx=(0, 12), pady=(8, 2), sticky="w")
-        self.details = Collapsible(body.inner, title="Détails résultats (référence maintenance L/v)", open=False)
+        self.details = Collapsible(
+            body.inner,
+            title="Détails résultats (référence maintenance L/v)",
+            open=False,
+            builder=self._build_details_content,
+        )
         self.details.pack(fill="x", padx=18, pady=(8, 0))
-        card_out = self._card(self.details.body, fill="both", expand=True)
-        card_out.bind("<Configure>", lambda e: self.lbl_analysis_info.configure(wraplength=max(200, int(e.width * 0.85))))
+        footer = ttk.Frame(body.inner, style="TFrame")
+        footer.pack(fill="x", padx=18, pady=(0, 16))
+        ttk.Label(footer, text="Astuce : lance un calcul pour activer la simulation en temps réel.", style="Footer.TLabel").pack(anchor="w")
+        self._reset_kpis()
+        for i in range(len(self.stage_status)):
+            self._set_stage_status(i, "idle")
+
+    def _build_details_content(self, parent):
+        card_out = self._card(parent, padding=_DENSITY[self.compact_mode][0], fill="both", expand=True)
+        card_out.bind("<Configure>", self._on_resize_wrapping)
         card_out.columnconfigure(0, weight=1)
         ttk.Label(card_out, text="Résultats", style="CardHeading.TLabel").pack(anchor="w", pady=(0, 12))
-        self.lbl_total_big = ttk.Label(card_out, text="Référence maintenance (L/v) : --", style="Result.TLabel")
+        self.lbl_total_big = ttk.Label(card_out, textvariable=self.total_big_var, style="Result.TLabel")
         self.lbl_total_big.pack(anchor="w", pady=(0, 10))
-        ttk.Label(card_out, text="Formule : tᵢ = Lconvᵢ · Cᵢ / UIᵢ  — UI en IHM (x100), conversion automatique IHM↔Hz.", style="HeroSub.TLabel", wraplength=820, justify="left").pack(anchor="w", pady=(4, 2))
-        self.lbl_analysis_info = ttk.Label(card_out, text="", style="Hint.TLabel", wraplength=820, justify="left")
+        formula = ttk.Label(card_out, text="Formule : tᵢ = Lconvᵢ · Cᵢ / UIᵢ  — UI en IHM (x100), conversion automatique IHM↔Hz.", style="HeroSub.TLabel", wraplength=820, justify="left")
+        formula.pack(anchor="w", pady=(4, 2))
+        self.lbl_analysis_info = ttk.Label(card_out, textvariable=self.analysis_info_var, style="Hint.TLabel", wraplength=820, justify="left")
         self.lbl_analysis_info.pack(anchor="w", pady=(0, 12))
-        self.parts_section_label = ttk.Label(card_out, text="Référence maintenance (L/v)", style="CardHeading.TLabel")
-        self.parts_section_label.pack(anchor="w", pady=(8, 0))
+        self._responsive_labels.update((formula, self.lbl_analysis_info))
+        ttk.Label(card_out, text="Référence maintenance (L/v)", style="CardHeading.TLabel").pack(anchor="w", pady=(8, 0))
         stage_list = ttk.Frame(card_out, style="CardInner.TFrame")
         stage_list.pack(fill="x", pady=(0, 12))
-        self.stage_rows = []
+        stage_list.columnconfigure(2, weight=1)
         for i in range(3):
-            row = ttk.Frame(stage_list, style="StageRow.TFrame")
-            row.pack(fill="x", pady=6)
-            row.columnconfigure(2, weight=1)
-            ttk.Label(row, text=f"Tapis {i + 1}", style="StageTitle.TLabel").grid(row=0, column=0, rowspan=2, sticky="w")
-            freq_lbl = ttk.Label(row, text="-- Hz", style="StageFreq.TLabel")
-            freq_lbl.grid(row=0, column=1, sticky="w", padx=(12, 0))
-            time_lbl = ttk.Label(row, text="--", style="StageTime.TLabel")
-            time_lbl.grid(row=0, column=2, sticky="e")
-            detail_lbl = ttk.Label(row, text="--", style="StageTimeDetail.TLabel")
-            detail_lbl.grid(row=1, column=2, sticky="e")
-            self.stage_rows.append({"freq": freq_lbl, "time": time_lbl, "detail": detail_lbl})
+            top, bottom = 2 * i, 2 * i + 1
+            ttk.Label(stage_list, text=f"Tapis {i + 1}", style="StageTitle.TLabel").grid(row=top, column=0, rowspan=2, sticky="w", pady=6)
+            freq_lbl = ttk.Label(stage_list, text="-- Hz", style="StageFreq.TLabel")
+            freq_lbl.grid(row=top, column=1, sticky="w", padx=(12, 0), pady=(6, 0))
+            time_lbl = ttk.Label(stage_list, text="--", style="StageTime.TLabel")
+            time_lbl.grid(row=top, column=2, sticky="e", pady=(6, 0))
+            detail_lbl = ttk.Label(stage_list, text="--", style="StageTimeDetail.TLabel")
+            detail_lbl.grid(row=bottom, column=2, sticky="e", pady=(0, 6))
+            self.stage_rows.append((freq_lbl, time_lbl, detail_lbl))
         ttk.Separator(card_out, style="Dark.TSeparator").pack(fill="x", pady=8)
-        footer = ttk.Frame(body.inner, style="TFrame")
-        footer.pack(fill="x", padx=18, pady=(0, 16))
-        ttk.Label(footer, text="Astuce : lance un calcul pour activer la simulation en temps réel.", style="Footer.TLabel").pack(anchor="w")
-        for key in ("total", "t1", "t2", "t3"):
-            self._update_kpi(key, "--", "--")
-        for i in range(len(self.stage_status)):
-            self._set_stage_status(i, "idle")
+        self._fill_stage_rows()
 
     def set_operator_mode(self, on: bool):
         self.operator_mode = bool(on)
@@ -953,47 +1225,51 @@ class FourApp(tk.Tk):
         if not self.last_calc:
             return
         if hasattr(self, "bars_heading_label"):
-            self.bars_heading_label.config(text="Barres de chargement — Référence maintenance (L/v)")
-        targets = self.last_calc.get("parts_reparties")
+            self._set_label(self.bars_heading_label, "Barres de chargement — Référence maintenance (L/v)")
+        targets = self.last_calc.parts_reparties
         if not targets:
             return
-        seconds = [max(0.0, float(value) * 60.0) for value in targets]
         if self.animating:
             return
+        arr = np.maximum(np.asarray(targets, dtype=np.float64) * 60.0, 0.0)
+        seconds = arr.tolist()
         self.seg_durations = seconds
-        self.total_duration = sum(seconds)
+        self.total_duration = float(arr.sum())
+        self._refresh_segment_constants()
         if not self.bars:
             return
         for idx in range(min(len(self.bars), len(seconds))):
             bar = self.bars[idx]
             txt = self.bar_texts[idx]
-            try:
-                freq = float(self.seg_speeds[idx])
-            except Exception:
-                freq = 0.0
-            target_sec = seconds[idx]
-            bar.set_total_distance(target_sec)
+            bar.set_total_distance(seconds[idx])
             bar.set_progress(0.0)
-            txt.config(text=f"0.0% | vitesse {freq:.2f} Hz | 00:00:00 / {fmt_hms(target_sec)} | en attente")
+            self._set_label(txt, self.seg_texts[idx].waiting)
 
     def _apply_parts(self):
         data = self.last_calc
         if not data:
             return
-        parts = tuple(data.get("parts_reparties") or (0.0, 0.0, 0.0))
-        f_values = (data.get("f1"), data.get("f2"), data.get("f3"))
-        if hasattr(self, "parts_section_label"):
-            self.parts_section_label.config(text="Référence maintenance (L/v)")
-        for row, part, freq in zip(self.stage_rows, parts, f_values):
-            row["time"].config(text=fmt_minutes(part))
-            row["detail"].config(text=f"{part:.2f} min | {fmt_hms(part * 60)}")
-            if freq is not None:
-                row["freq"].config(text=f"{float(freq):.2f} Hz")
-        self._update_kpi("t1", fmt_minutes(parts[0]), f"{parts[0]:.2f} min | {fmt_hms(parts[0] * 60)}")
-        self._update_kpi("t2", fmt_minutes(parts[1]), f"{parts[1]:.2f} min | {fmt_hms(parts[1] * 60)}")
-        self._update_kpi("t3", fmt_minutes(parts[2]), f"{parts[2]:.2f} min | {fmt_hms(parts[2] * 60)}")
+        texts = [_part_texts(part) for part in data.parts_reparties]
+        self._update_kpis(texts)
+        self._fill_stage_rows(texts)
         self._update_bar_targets()
 
+    def _fill_stage_rows(self, texts: list[tuple[str, str]] | None = None):
+        data = self.last_calc
+        if not data or not self.stage_rows:
+            return
+        if texts is None:
+            texts = [_part_texts(part) for part in data.parts_reparties]
+        f_values = (data.f1, data.f2, data.f3)
+        updates: list[tuple[ttk.Label, str]] = []
+        for (freq_lbl, time_lbl, detail_lbl), (main_text, detail_text), freq in zip(self.stage_rows, texts, f_values):
+            updates.append((time_lbl, main_text))
+            updates.append((detail_lbl, detail_text))
+            updates.append((freq_lbl, f"{freq:.2f} Hz"))
+        with self._batch_updates(idle=False):
+            for lbl, text in updates:
+                self._set_label(lbl, text)
+
     def _apply_graph_geometry(self, seg_times: dict[str, float], h1: float, h2: float, h3: float) -> None:
         if not getattr(self, "graph_bars", None):
             return
@@ -1010,64 +1286,65 @@ class FourApp(tk.Tk):
                 graph.set_geometry(geom, offset)
         self._update_graphs(0.0)
 
-    def on_reset(self):
+    def on_reset(self, _event=None):
         self._cancel_after()
+        self._cancel_notifications()
         self.animating = False
         self.paused = False
         self.seg_idx = 0
-        self.seg_start = 0.0
-        self._clear_error()
-        self._clear_toasts()
-        for b, t in zip(self.bars, self.bar_texts):
-            b.reset()
-            t.config(text="En attente")
-            try:
-                b.set_holes([])
-                b.set_curve_alpha(0.0)
-            except Exception:
-                pass
-        for row in self.stage_rows:
-            row["freq"].config(text="-- Hz")
-            row["time"].config(text="--")
-            row["detail"].config(text="--")
-        for lbl in getattr(self, "bar_duration_labels", []):
-            try:
-                lbl.config(text="")
-            except Exception:
-                pass
+        self.seg_elapsed_ms = 0
+        self._reset_tick_timing()
         self.feed_events.clear()
+        self._open_gap = None
+        self._holes_shown = [[], [], []]
         self.feed_on = True
         self.feed_timeline.reset(0.0, 0.0, 0)
         self.fill_alpha = 0.0
-        if hasattr(self, "btn_feed_stop"):
-            self.btn_feed_stop.config(state="disabled")
-        if hasattr(self, "btn_feed_resume"):
-            self.btn_feed_resume.config(state="disabled")
-        self.lbl_total_big.config(text="Référence maintenance (L/v) : --")
-        self.lbl_analysis_info.config(text="")
-        if self.bars_heading_label is not None:
-            self.bars_heading_label.config(text="Barres de chargement — Référence maintenance (L/v)")
-        self.btn_start.config(state="disabled")
-        self.btn_pause.config(state="disabled", text="⏸ Pause")
-        self.btn_calculer.config(state="normal")
-        self._update_graphs(0.0)
-        if self.product_curve_widget:
-            self.product_curve_widget.reset_segments()
-            self.product_curve_widget.set_feeding(False)
-        self._curve_last_tick = None
         self.seg_durations = [0.0, 0.0, 0.0]
         self.seg_distances = [0.0, 0.0, 0.0]
         self.seg_speeds = [0.0, 0.0, 0.0]
-        self._update_curve_speeds()
+        self._refresh_segment_constants()
         self.total_duration = 0.0
-        self.notified_stage1 = False
-        self.notified_stage2 = False
         self.notified_exit = False
         self.last_calc = None
-        for key in ("total", "t1", "t2", "t3"):
-            self._update_kpi(key, "--", "--")
-        for i in range(len(self.stage_status)):
-            self._set_stage_status(i, "idle")
+        with self._batch_updates(idle=False):
+            self._clear_error()
+            self._clear_toasts()
+            for b, t in zip(self.bars, self.bar_texts):
+                b.reset()
+                self._set_label(t, "En attente")
+                try:
+                    b.set_holes([])
+                    b.set_curve_alpha(0.0)
+                except Exception:
+                    pass
+            for freq_lbl, time_lbl, detail_lbl in self.stage_rows:
+                self._set_label(freq_lbl, "-- Hz")
+                self._set_label(time_lbl, "--")
+                self._set_label(detail_lbl, "--")
+            for lbl in getattr(self, "bar_duration_labels", []):
+                try:
+                    self._set_label(lbl, "")
+                except Exception:
+                    pass
+            self.btn_feed_stop.config(state="disabled")
+            self.btn_feed_resume.config(state="disabled")
+            self.total_big_var.set("Référence maintenance (L/v) : --")
+            self.analysis_info_var.set("")
+            if self.bars_heading_label is not None:
+                self._set_label(self.bars_heading_label, "Barres de chargement — Référence maintenance (L/v)")
+            self.btn_start.config(state="disabled")
+            self.btn_pause.config(state="disabled")
+            self._set_label(self.btn_pause, "⏸ Pause")
+            self.btn_calculer.config(state="normal")
+            self._update_graphs(0.0)
+            if self.product_curve_widget:
+                self.product_curve_widget.reset_segments()
+                self.product_curve_widget.set_feeding(False)
+            self._update_curve_speeds()
+            self._reset_kpis()
+            for i in range(len(self.stage_status)):
+                self._set_stage_status(i, "idle")
 
     def on_graphs(self):
         if not self.last_calc:
@@ -1082,6 +1359,7 @@ class FourApp(tk.Tk):
                 self.graph_window.redraw_with_mode("maintenance")
             else:
                 self.graph_window = GraphWindow(self)
+                self._themed_windows.add(self.graph_window)
                 self.graph_window.redraw_with_mode("maintenance")
         except Exception as e:
             self._show_error(f"Impossible d'ouvrir le graphique : {e}")
@@ -1093,23 +1371,24 @@ class FourApp(tk.Tk):
             except Exception:
                 return
         try:
-            if getattr(self, "details_window", None) and self.details_window.winfo_exists():
+            if self.details_window and self.details_window.winfo_exists():
                 self.details_window.lift()
                 self.details_window.refresh_from_app()
             else:
                 self.details_window = DetailsWindow(self)
+                self._themed_windows.add(self.details_window)
         except Exception as e:
             self._show_error(f"Impossible d'ouvrir les détails : {e}")
 
     def on_details_segments(self):
-        calc = self.last_calc or {}
-        seg = calc.get("segments") or {}
+        calc = self.last_calc
+        seg = (calc.segments if calc else None) or {}
         times = seg.get("times_min") or {}
         if not times:
             self._show_error("Aucun détail segment. Lance d’abord un calcul.")
             return
 
-        t1, t2, t3 = calc.get("parts_reparties", (0.0, 0.0, 0.0))
+        t1, t2, t3 = calc.parts_reparties
 
         def line(label, minutes):
             return f"{label:<18}  {fmt_minutes(minutes):>8}  ({minutes:6.2f} min | {fmt_hms(minutes * 60)})"
@@ -1148,26 +1427,28 @@ class FourApp(tk.Tk):
 
         win = tk.Toplevel(self)
         win.title("Détails — Cellules, transferts, entrée")
-        bg = getattr(self, "BG", BG)
-        card = getattr(self, "CARD", CARD)
-        text_color = getattr(self, "TEXT", TEXT)
+        bg = getattr(self, "BG", theme.BG)
+        card = getattr(self, "CARD", theme.CARD)
+        text_color = getattr(self, "TEXT", theme.TEXT)
         win.configure(bg=bg)
         win.geometry("760x640")
 
         box = scrolledtext.ScrolledText(
             win,
             wrap="word",
-            font=("Consolas", 11),
+            font="AppMono",
             bg=card,
             fg=text_color,
             insertbackground=text_color,
         )
         box.pack(fill="both", expand=True, padx=12, pady=12)
+        self._themed_windows.add(win)
+        self._themed_texts.add(box)
         box.insert("1.0", "\n".join(lines))
         box.configure(state="disabled")
 
 
-    def on_calculer(self):
+    def on_calculer(self, _event=None):
         if self.animating or self.paused:
             self.on_reset()
         else:
@@ -1189,17 +1470,20 @@ class FourApp(tk.Tk):
         except Exception as exc:
             self._show_error(f"Calcul maintenance indisponible : {exc}")
             return
-        parts_minutes = (result.t1_min, result.t2_min, result.t3_min)
-        freq_display = (float(result.f1_hz), float(result.f2_hz), float(result.f3_hz))
+        seg = np.array(
+            ((result.t1_min, result.t2_min, result.t3_min), (result.f1_hz, result.f2_hz, result.f3_hz)),
+            dtype=float,
+        )
+        parts_minutes = tuple(seg[0].tolist())
+        freq_display = tuple(seg[1].tolist())
         self.seg_distances = [0.0, 0.0, 0.0]
-        self.seg_speeds = [float(val) for val in freq_display]
+        self.seg_speeds = list(freq_display)
         self._update_curve_speeds()
-        self.seg_durations = [value * 60.0 for value in parts_minutes]
+        self.seg_durations = (seg[0] * 60.0).tolist()
+        self._refresh_segment_constants()
         self.total_duration = float(result.total_s)
-        self.notified_stage1 = False
-        self.notified_stage2 = False
         self.notified_exit = False
-        self.last_calc = dict(
+        self.last_calc = LastCalc(
             f1=freq_display[0],
             f2=freq_display[1],
             f3=freq_display[2],
@@ -1218,38 +1502,20 @@ class FourApp(tk.Tk):
         cells_belt2 = visible_cells_for_tapis(2)
         cells_belt3 = visible_cells_for_tapis(3)
         # ---- Détails segments: entrée / cellules / transferts ----
-        for lbl in getattr(self, "bar_duration_labels", []):
-            try:
-                lbl.config(text="")
-            except Exception:
-                pass
+        for lbl in self.bar_duration_labels:
+            self._set_label(lbl, "")
         seg_times: dict[str, float] = {}
         try:
             weights = load_segment_weights()
-            t1, t2, t3 = self.last_calc["parts_reparties"]  # minutes par tapis (t1_min, t2_min, t3_min)
+            t1, t2, t3 = self.last_calc.parts_reparties  # minutes par tapis (t1_min, t2_min, t3_min)
             seg_times = compute_segment_times_minutes(t1, t2, t3, weights)
-            self.last_calc["segments"] = {"weights": weights, "times_min": seg_times}
-
-            def _fmt_min(val: float) -> str:
-                return f"{val:.2f} min"
-            try:
-                if self.bar_duration_labels:
-                    parts = [f"Entrée : {_fmt_min(seg_times.get('entry1', 0.0))}"]
-                    for cell_id in cells_belt1:
-                        parts.append(f"Cellule {cell_id} : {_fmt_min(seg_times.get(f'c{cell_id}', 0.0))}")
-                    self.bar_duration_labels[0].config(text="  |  ".join(parts))
-                if len(self.bar_duration_labels) > 1:
-                    parts = [f"Transfert 1 : {_fmt_min(seg_times.get('transfer1', 0.0))}"]
-                    for cell_id in cells_belt2:
-                        parts.append(f"Cellule {cell_id} : {_fmt_min(seg_times.get(f'c{cell_id}', 0.0))}")
-                    self.bar_duration_labels[1].config(text="  |  ".join(parts))
-                if len(self.bar_duration_labels) > 2:
-                    parts = [f"Transfert 2 : {_fmt_min(seg_times.get('transfer2', 0.0))}"]
-                    for cell_id in cells_belt3:
-                        parts.append(f"Cellule {cell_id} : {_fmt_min(seg_times.get(f'c{cell_id}', 0.0))}")
-                    self.bar_duration_labels[2].config(text="  |  ".join(parts))
-            except Exception:
-                pass
+            self.last_calc.segments = {"weights": weights, "times_min": seg_times}
+            for lbl, (head_key, head_label), cells in zip(
+                self.bar_duration_labels, _BAR_DURATION_HEADS, (cells_belt1, cells_belt2, cells_belt3)
+            ):
+                parts = [f"{head_label} : {seg_times.get(head_key, 0.0):.2f} min"]
+                parts.extend(f"Cellule {c} : {seg_times.get(f'c{c}', 0.0):.2f} min" for c in cells)
+                self._set_label(lbl, "  |  ".join(parts))
 
             # Marqueurs réalistes sur les barres (fin de chaque sous-segment sauf le dernier)
             blk1 = [("entry1", seg_times.get("entry1", 0.0))]
@@ -1277,95 +1543,82 @@ class FourApp(tk.Tk):
         except Exception:
             # En cas de souci de chargement JSON etc., on ne casse pas le calcul principal
             pass
-        for row, minutes, freq, hms in zip(self.stage_rows, parts_minutes, freq_display, (result.t1_hms, result.t2_hms, result.t3_hms)):
-            row["time"].config(text=fmt_minutes(minutes))
-            row["detail"].config(text=f"{minutes:.2f} min | {hms}")
-            row["freq"].config(text=f"{freq:.2f} Hz")
-        self._update_kpi("t1", fmt_minutes(parts_minutes[0]), f"{parts_minutes[0]:.2f} min | {result.t1_hms}")
-        self._update_kpi("t2", fmt_minutes(parts_minutes[1]), f"{parts_minutes[1]:.2f} min | {result.t2_hms}")
-        self._update_kpi("t3", fmt_minutes(parts_minutes[2]), f"{parts_minutes[2]:.2f} min | {result.t3_hms}")
-        self._update_kpi("total", fmt_minutes(result.total_min), f"{float(result.total_min):.2f} min | {result.total_hms}")
-        self.lbl_total_big.config(text=f"Référence maintenance (L/v) : {fmt_minutes(result.total_min)} | {result.total_hms}")
-        try:
-            h0_cm = float(self.h0.get().replace(",", "."))
-            if not (h0_cm > 0):
-                raise ValueError
-        except Exception:
-            h0_cm = 2.0
-        th = thickness_and_accum(self.seg_speeds[0], self.seg_speeds[1], self.seg_speeds[2], h0_cm)
-        n1 = max(1, len(cells_belt1))
-        n2 = max(1, len(cells_belt2))
-        n3 = max(1, len(cells_belt3))
-        profile1 = [1.0] * n1
-        profile2 = list(CELL_PROFILE_2) if len(CELL_PROFILE_2) == n2 else [1.0] * n2
-        profile3 = [0.55, 0.45] if n3 == 2 else (list(CELL_PROFILE_3) if len(CELL_PROFILE_3) == n3 else [1.0] * n3)
-        curve1 = piecewise_curve_normalized(th["h1_cm"], th["h1_cm"], n1, profile1)
-        curve2 = piecewise_curve_normalized(th["h1_cm"], th["h2_cm"], n2, profile2)
-        curve3 = piecewise_curve_normalized(th["h2_cm"], th["h3_cm"], n3, profile3)
-        self.fill_alpha = 0.0
-        for bar, curve in zip(self.bars, (curve1, curve2, curve3)):
+        with self._batch_updates():
+            total_text = fmt_minutes(result.total_min)
+            self._update_kpi(self.kpi_total, total_text, f"{float(result.total_min):.2f} min | {result.total_hms}")
+            self.total_big_var.set(f"Référence maintenance (L/v) : {total_text} | {result.total_hms}")
             try:
-                bar.set_curve(curve, y_max_cm=DISPLAY_Y_MAX_CM)
-                bar.set_curve_alpha(self.fill_alpha)
+                h0_cm = float(self.h0.get().replace(",", "."))
+                if not (h0_cm > 0):
+                    raise ValueError
             except Exception:
-                pass
-        self._apply_graph_geometry(seg_times, th["h1_cm"], th["h2_cm"], th["h3_cm"])
-        self._build_product_curve_data(seg_times, th["h1_cm"], th["h2_cm"], th["h3_cm"], cells_belt1, cells_belt2, cells_belt3)
-        if self.product_curve_widget:
-            self.product_curve_widget.reset_segments()
-            self.product_curve_widget.set_feeding(False)
-        self._curve_last_tick = None
-        def _badge_style(pct: float) -> str:
-            if pct > 0.5:
-                return "BadgeActive.TLabel"
-            if pct < -0.5:
-                return "BadgeReady.TLabel"
-            return "BadgeNeutral.TLabel"
-        if len(self.accum_badges) > 1 and self.accum_badges[1] is not None:
-            txt12 = f"Variation épaisseur 1→2 : {th['A12_pct']:+.0f}% | h₂≈{th['h2_cm']:.2f} cm"
-            self.accum_badges[1].config(text=txt12, style=_badge_style(th["A12_pct"]))
-        if len(self.accum_badges) > 2 and self.accum_badges[2] is not None:
-            txt23 = f"Variation épaisseur 2→3 : {th['A23_pct']:+.0f}% | h₃≈{th['h3_cm']:.2f} cm"
-            self.accum_badges[2].config(text=txt23, style=_badge_style(th["A23_pct"]))
-        self.feed_events.clear()
-        self.feed_on = True
-        if hasattr(self, "btn_feed_stop"):
+                h0_cm = 2.0
+            th = thickness_and_accum(self.seg_speeds[0], self.seg_speeds[1], self.seg_speeds[2], h0_cm)
+            n1 = max(1, len(cells_belt1))
+            n2 = max(1, len(cells_belt2))
+            n3 = max(1, len(cells_belt3))
+            profile1 = [1.0] * n1
+            profile2 = list(CELL_PROFILE_2) if len(CELL_PROFILE_2) == n2 else [1.0] * n2
+            profile3 = [0.55, 0.45] if n3 == 2 else (list(CELL_PROFILE_3) if len(CELL_PROFILE_3) == n3 else [1.0] * n3)
+            curve1 = piecewise_curve_normalized(th["h1_cm"], th["h1_cm"], n1, profile1)
+            curve2 = piecewise_curve_normalized(th["h1_cm"], th["h2_cm"], n2, profile2)
+            curve3 = piecewise_curve_normalized(th["h2_cm"], th["h3_cm"], n3, profile3)
+            self.fill_alpha = 0.0
+            for bar, curve in zip(self.bars, (curve1, curve2, curve3)):
+                try:
+                    bar.set_curve(curve, y_max_cm=DISPLAY_Y_MAX_CM)
+                    bar.set_curve_alpha(self.fill_alpha)
+                except Exception:
+                    pass
+            self._apply_graph_geometry(seg_times, th["h1_cm"], th["h2_cm"], th["h3_cm"])
+            self._build_product_curve_data(seg_times, th["h1_cm"], th["h2_cm"], th["h3_cm"], cells_belt1, cells_belt2, cells_belt3)
+            if self.product_curve_widget:
+                self.product_curve_widget.reset_segments()
+                self.product_curve_widget.set_feeding(False)
+            if len(self.accum_badges) > 1 and self.accum_badges[1] is not None:
+                txt12 = f"Variation épaisseur 1→2 : {th['A12_pct']:+.0f}% | h₂≈{th['h2_cm']:.2f} cm"
+                self._set_badge(self.accum_badges[1], txt12, _accum_badge_style(th["A12_pct"]))
+            if len(self.accum_badges) > 2 and self.accum_badges[2] is not None:
+                txt23 = f"Variation épaisseur 2→3 : {th['A23_pct']:+.0f}% | h₃≈{th['h3_cm']:.2f} cm"
+                self._set_badge(self.accum_badges[2], txt23, _accum_badge_style(th["A23_pct"]))
+            self.feed_events.clear()
+            self._open_gap = None
+            self._holes_shown = [[], [], []]
+            self.feed_on = True
             self.btn_feed_stop.config(state="disabled")
-        if hasattr(self, "btn_feed_resume"):
             self.btn_feed_resume.config(state="disabled")
-        for bar in self.bars:
+            for bar in self.bars:
+                try:
+                    bar.set_holes([])
+                except Exception:
+                    pass
+            for txt in self.bar_texts:
+                self._set_label(txt, "En attente")
+            info = (
+                "Mode maintenance L/v : tᵢ = Lconvᵢ · Cᵢ / UIᵢ (référence tableur). "
+                f"UI saisis = {f1_in:.2f} / {f2_in:.2f} / {f3_in:.2f} → Hz = {freq_display[0]:.2f} / {freq_display[1]:.2f} / {freq_display[2]:.2f}. "
+                f"t₁={result.t1_hms}, t₂={result.t2_hms}, t₃={result.t3_hms} | Total={result.total_hms}"
+            )
+            self.analysis_info_var.set(info)
+            self._apply_parts()
             try:
-                bar.set_holes([])
+                if self.graph_window and self.graph_window.winfo_exists():
+                    self.graph_window.redraw_with_mode("maintenance")
+            except Exception:
+                pass
+            self.total_duration = sum(self.seg_durations)
+            self.notified_exit = False
+            self.btn_start.config(state="normal")
+            self.btn_pause.config(state="disabled")
+            self._set_label(self.btn_pause, "⏸ Pause")
+            self.btn_calculer.config(state="normal")
+            try:
+                if self.details_window and self.details_window.winfo_exists():
+                    self.details_window.refresh_from_app()
             except Exception:
                 pass
-        for txt in self.bar_texts:
-            txt.config(text="En attente")
-        info = (
-            "Mode maintenance L/v : tᵢ = Lconvᵢ · Cᵢ / UIᵢ (référence tableur). "
-            f"UI saisis = {f1_in:.2f} / {f2_in:.2f} / {f3_in:.2f} → Hz = {freq_display[0]:.2f} / {freq_display[1]:.2f} / {freq_display[2]:.2f}. "
-            f"t₁={result.t1_hms}, t₂={result.t2_hms}, t₃={result.t3_hms} | Total={result.total_hms}"
-        )
-        self.lbl_analysis_info.config(text=info)
-        self._apply_parts()
-        try:
-            if hasattr(self, "graph_window") and self.graph_window and self.graph_window.winfo_exists():
-                self.graph_window.redraw_with_mode("maintenance")
-        except Exception:
-            pass
-        self.total_duration = sum(self.seg_durations)
-        self.notified_stage1 = False
-        self.notified_stage2 = False
-        self.notified_exit = False
-        self.btn_start.config(state="normal")
-        self.btn_pause.config(state="disabled", text="⏸ Pause")
-        self.btn_calculer.config(state="normal")
-        try:
-            if getattr(self, "details_window", None) and self.details_window.winfo_exists():
-                self.details_window.refresh_from_app()
-        except Exception:
-            pass
 
-    def on_start(self):
+    def on_start(self, _event=None):
         if self.animating:
             return
         if sum(self.seg_durations) <= 0:
@@ -1375,19 +1628,22 @@ class FourApp(tk.Tk):
         self.animating = True
         self.paused = False
         self.seg_idx = 0
-        self.seg_start = time.perf_counter()
+        self.seg_elapsed_ms = 0
+        self._reset_tick_timing()
+        self._progress_key = None
+        self._progress_px = None
         if self.product_curve_widget:
             self.product_curve_widget.reset_segments()
             self.product_curve_widget.set_feeding(True)
-        self._curve_last_tick = self.seg_start
         self.total_duration = sum(self.seg_durations)
-        self.notified_stage1 = False
-        self.notified_stage2 = False
         self.notified_exit = False
         self.btn_start.config(state="disabled")
-        self.btn_pause.config(state="normal", text="⏸ Pause")
+        self.btn_pause.config(state="normal")
+        self._set_label(self.btn_pause, "⏸ Pause")
         self.btn_calculer.config(state="disabled")
         self.feed_events.clear()
+        self._open_gap = None
+        self._holes_shown = [[], [], []]
         self.feed_on = True
         self.feed_timeline.reset(0.0, 0.0, 1)
         self.fill_alpha = 0.0
@@ -1404,48 +1660,51 @@ class FourApp(tk.Tk):
         self._set_stage_status(1, "ready")
         self._set_stage_status(2, "idle")
         self._cancel_after()
+        self._update_tick_interval()
+        self._schedule_notifications()
         self._tick()
 
     def _set_stage_status(self, index, status):
         if not (0 <= index < len(self.stage_status)):
             return
-        label = self.stage_status[index]
-        mapping = {
-            "idle": ("⏳ En attente", "BadgeIdle.TLabel"),
-            "ready": ("▶ Prêt", "BadgeReady.TLabel"),
-            "active": ("⏵ En cours", "BadgeActive.TLabel"),
-            "done": ("✓ Terminé", "BadgeDone.TLabel"),
-            "pause": ("⏸ En pause", "BadgePause.TLabel"),
-        }
-        text_value, style_name = mapping.get(status, ("⏳ En attente", "BadgeIdle.TLabel"))
-        label.config(text=text_value, style=style_name)
+        if status not in _STAGE_STATUS:
+            status = "idle"
+        if self._stage_status_cache.get(index) == status:
+            return
+        text_value, style_name = _STAGE_STATUS[status]
+        self.tk.call(str(self.stage_status[index]), "configure", "-text", text_value, "-style", style_name)
+        self._stage_status_cache[index] = status
 
-    def on_pause(self):
+    def on_pause(self, _event=None):
         if not self.animating:
             return
         if not self.paused:
             self.paused = True
-            self.pause_t0 = time.perf_counter()
             self._cancel_after()
-            self.btn_pause.config(text="▶ Reprendre")
+            self._cancel_notifications()
+            self._tick_paused_at = time.perf_counter()
+            self._set_label(self.btn_pause, "▶ Reprendre")
             self._set_stage_status(self.seg_idx, "pause")
-            self._curve_last_tick = None
         else:
-            delta = time.perf_counter() - self.pause_t0
-            self.seg_start += delta
             self.paused = False
-            self.btn_pause.config(text="⏸ Pause")
+            self._set_label(self.btn_pause, "⏸ Pause")
             self._set_stage_status(self.seg_idx, "active")
-            self._curve_last_tick = time.perf_counter()
+            if self._tick_sched_at is not None:
+                self._tick_sched_at += time.perf_counter() - self._tick_paused_at
+                self._tick_delay_ms = 0
+            self._schedule_notifications()
             self._tick()
 
     def _sim_minutes(self) -> float:
-        base_min = sum(self.seg_durations[: self.seg_idx]) / 60.0
+        i = self.seg_idx
+        base_ms = self.seg_start_ms[i]
         if not self.animating:
-            return base_min
-        if self.paused:
-            return base_min + max(0.0, self.pause_t0 - self.seg_start) / 60.0
-        return base_min + (time.perf_counter() - self.seg_start) / 60.0
+            return base_ms / 60000.0
+        elapsed_ms = self.seg_elapsed_ms
+        if self._tick_sched_at is not None:
+            now = self._tick_paused_at if self.paused else time.perf_counter()
+            elapsed_ms += (now - self._tick_sched_at) * 1000.0
+        return (base_ms + min(elapsed_ms, self.seg_dur_ms[i])) / 60000.0
 
     def on_feed_stop(self):
         if not self.animating:
@@ -1454,7 +1713,8 @@ class FourApp(tk.Tk):
         if not self.feed_on:
             return
         tnow = self._sim_minutes()
-        self.feed_events.append(GapEvent(start_min=tnow))
+        self._open_gap = GapEvent(start_min=tnow)
+        self.feed_events.append(self._open_gap)
         self.feed_on = False
         self.feed_timeline.set_target(0, tnow)
         self.btn_feed_stop.config(state="disabled")
@@ -1470,10 +1730,9 @@ class FourApp(tk.Tk):
         if self.feed_on:
             return
         tnow = self._sim_minutes()
-        for ev in reversed(self.feed_events):
-            if ev.end_min is None:
-                ev.end_min = tnow
-                break
+        if self._open_gap is not None:
+            self._open_gap.end_min = tnow
+            self._open_gap = None
         self.feed_on = True
         self.feed_timeline.set_target(1, tnow)
         self.btn_feed_stop.config(state="normal")
@@ -1484,51 +1743,48 @@ class FourApp(tk.Tk):
         self._update_graphs(tnow)
 
     def _tick(self):
+        self._after_id = None
         if not self.animating or self.paused:
             return
-        i = self.seg_idx
-        dur = max(1e-6, self.seg_durations[i])
-        vitesse = self.seg_speeds[i]
         now = time.perf_counter()
-        if self.product_curve_widget:
-            if self._curve_last_tick is None:
-                self._curve_last_tick = now
-            else:
-                dt = max(0.0, now - self._curve_last_tick)
-                if dt > 0.0:
-                    try:
-                        self.product_curve_widget.tick(dt)
-                    except Exception:
-                        pass
-                self._curve_last_tick = now
-        else:
-            self._curve_last_tick = now
-        elapsed_raw = now - self.seg_start
-        elapsed = max(0.0, elapsed_raw)
-        clamped_elapsed = min(elapsed, dur)
-        t_now_min = (sum(self.seg_durations[: self.seg_idx]) + clamped_elapsed) / 60.0
+        step_ms = 0
+        if self._tick_sched_at is not None:
+            step_ms = round((now - self._tick_sched_at) * 1000)
+            if self._tick_delay_ms:
+                self._tick_overheads.append(step_ms - self._tick_delay_ms)
+        with self._batch_updates(idle=False):
+            try:
+                self._advance_simulation(step_ms, now)
+            finally:
+                if self.animating and not self.paused:
+                    self._schedule_tick(now)
+
+    def _advance_simulation(self, step_ms, now):
+        i = self.seg_idx
+        dur_ms = max(1, self.seg_dur_ms[i])
+        texts = self.seg_texts[i]
+        self.seg_elapsed_ms += step_ms
+        if self.product_curve_widget and step_ms > 0:
+            try:
+                self.product_curve_widget.tick(step_ms / 1000.0)
+            except Exception:
+                pass
+        elapsed_ms = self.seg_elapsed_ms
+        clamped_ms = min(elapsed_ms, dur_ms)
+        t_now_min = (self.seg_start_ms[i] + clamped_ms) / 60000.0
         self._update_graphs(t_now_min)
-        remaining_current = max(0.0, dur - elapsed)
-        remaining_future = sum(self.seg_durations[j] for j in range(i + 1, 3))
-        total_remaining = max(0.0, remaining_current + remaining_future)
-        if not self.notified_exit and self.total_duration > 5 * 60 and total_remaining <= 5 * 60:
-            self.notified_exit = True
-            self.toast("Le produit va sortir du four (≤ 5 min)")
-        if elapsed >= dur:
-            clamped_elapsed = dur
-            self.bars[i].set_progress(dur)
-            self.bar_texts[i].config(text=f"100% | vitesse {vitesse:.2f} Hz | {fmt_hms(dur)} / {fmt_hms(dur)} | terminé")
-            if i == 0 and not self.notified_stage1:
-                self.toast("Passage → Tapis 2")
-                self.notified_stage1 = True
-            elif i == 1 and not self.notified_stage2:
-                self.toast("Passage → Tapis 3")
-                self.notified_stage2 = True
+        if elapsed_ms >= dur_ms:
+            self.bars[i].set_progress(self.seg_durations[i])
+            self._set_label(self.bar_texts[i], texts.done)
+            if i < 2:
+                self.toast(f"Passage → Tapis {i + 2}")
             self._set_stage_status(i, "done")
             self.seg_idx += 1
             if self.seg_idx >= 3:
                 self.animating = False
-                self.btn_pause.config(state="disabled", text="⏸ Pause")
+                self._cancel_notifications()
+                self.btn_pause.config(state="disabled")
+                self._set_label(self.btn_pause, "⏸ Pause")
                 self.btn_start.config(state="normal")
                 self.btn_calculer.config(state="normal")
                 self.feed_on = True
@@ -1536,37 +1792,33 @@ class FourApp(tk.Tk):
                 self.btn_feed_resume.config(state="disabled")
                 if self.product_curve_widget:
                     self.product_curve_widget.set_feeding(False)
-                self._curve_last_tick = None
                 return
-            self.seg_start = now
-            self._curve_last_tick = now
+            self.seg_elapsed_ms = elapsed_ms - dur_ms
             j = self.seg_idx
-            vitesse_j = self.seg_speeds[j]
-            duree_j = self.seg_durations[j]
-            self.bars[j].set_total_distance(duree_j)
-            self.bar_texts[j].config(text=f"0.0% | vitesse {vitesse_j:.2f} Hz | 00:00:00 / {fmt_hms(duree_j)} | en cours")
+            self.bars[j].set_total_distance(self.seg_durations[j])
+            self._set_label(self.bar_texts[j], self.seg_texts[j].started)
             self._set_stage_status(j, "active")
             if j + 1 < 3:
                 self._set_stage_status(j + 1, "ready")
-            self._schedule_tick()
+            self._update_tick_interval()
+            self._advance_simulation(0, now)
             return
-        pct = max(0.0, min(1.0, clamped_elapsed / dur)) * 100.0
-        self.bars[i].set_progress(clamped_elapsed)
-        self.bar_texts[i].config(text=f"{pct:5.1f}% | vitesse {vitesse:.2f} Hz | {fmt_hms(clamped_elapsed)} / {fmt_hms(dur)} | en cours")
-        try:
-            t1m = self.seg_durations[0] / 60.0
-            t2m = self.seg_durations[1] / 60.0
-            t3m = self.seg_durations[2] / 60.0
-            holes = holes_for_all_belts(self.feed_events, t_now_min, t1m, t2m, t3m)
-            for belt_idx, intervals in enumerate(holes):
-                try:
-                    self.bars[belt_idx].set_holes(intervals)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
-        self._schedule_tick()
+        permille = clamped_ms * 1000 // dur_ms
+        progress_key = (i, permille, (clamped_ms + 500) // 1000)
+        if progress_key != self._progress_key:
+            self._progress_key = progress_key
+            clamped_sec = clamped_ms / 1000.0
+            progress_px = (i, clamped_ms * self._bar_px // dur_ms)
+            if progress_px != self._progress_px:
+                self._progress_px = progress_px
+                self.bars[i].set_progress(clamped_sec)
+            self._set_label(self.bar_texts[i], f"{permille / 10:5.1f}{texts.run_head}{fmt_hms(clamped_sec)}{texts.run_tail}")
+        if self.feed_events:
+            holes = holes_for_all_belts(self.feed_events, t_now_min, *self.seg_minutes)
+            for bar, intervals, shown in zip(self.bars, holes, self._holes_shown):
+                if intervals != shown:
+                    bar.set_holes(intervals)
+            self._holes_shown = holes
 
     def export_csv(self):
         calc = self.last_calc
@@ -1578,9 +1830,7 @@ class FourApp(tk.Tk):
             return
         try:
             with open(path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f, delimiter=";")
-                for key, value in calc.items():
-                    writer.writerow([key, value])
+                f.write("".join(f"{key};{value}\r\n" for key, value in calc.items()))
             self.toast(f"Export CSV : {path}")
         except Exception as e:
             self._show_error(f"Export CSV impossible : {e}")
@@ -1604,51 +1854,73 @@ class FourApp(tk.Tk):
             return
         self.toast("Export PS : " + "; ".join(saved))
 
-    def on_explanations(self):
-        calc = self.last_calc or {}
+    @staticmethod
+    def _explanations_text(calc) -> str:
         try:
-            f1 = float(calc.get("f1", 0.0))
-            f2 = float(calc.get("f2", 0.0))
-            f3 = float(calc.get("f3", 0.0))
-            t1 = float(calc.get("t1s_min", 0.0))
-            t2 = float(calc.get("t2s_min", 0.0))
-            t3 = float(calc.get("t3s_min", 0.0))
-            T = float(calc.get("T_total_min", 0.0))
+            f1, f2, f3 = float(calc.f1), float(calc.f2), float(calc.f3)
+            t1, t2, t3 = float(calc.t1s_min), float(calc.t2s_min), float(calc.t3s_min)
+            T = float(calc.T_total_min)
         except Exception:
             f1 = f2 = f3 = t1 = t2 = t3 = T = 0.0
-        text = (
+        return (
             "RÉFÉRENCE MAINTENANCE (L/v)\n\n"
             "Principe : pour chaque tapis i, le temps est tᵢ = Lconvᵢ · Cᵢ / UIᵢ.\n"
             "L’application convertit automatiquement les valeurs UI (IHM x100) en Hz, "
             "et affiche t₁, t₂, t₃ ainsi que le total.\n\n"
             f"Dernier calcul : f = {f1:.2f}/{f2:.2f}/{f3:.2f} Hz • t = {t1:.2f}/{t2:.2f}/{t3:.2f} min • Total = {T:.2f} min."
         )
+
+    def on_explanations(self, _event=None):
+        calc = self.last_calc
+        key = tuple(getattr(calc, name, None) for name in _EXPLAIN_KEYS)
+        text_changed = key != self._explain_key
+        if text_changed:
+            self._explain_key = key
+            self._explain_text = self._explanations_text(calc)
+        win = self._explain_win
+        if win is not None and win.winfo_exists():
+            if text_changed:
+                txt = self._explain_txt
+                txt.configure(state="normal")
+                txt.delete("1.0", tk.END)
+                txt.insert("1.0", self._explain_text)
+                txt.configure(state="disabled")
+            win.deiconify()
+            win.lift()
+            return
         win = tk.Toplevel(self)
         win.title("Explications — Référence maintenance (L/v)")
-        win.configure(bg=BG)
+        win.configure(bg=theme.BG)
         win.geometry("900x640")
-        txt = scrolledtext.ScrolledText(win, wrap="word", font=("Consolas", 11), bg=CARD, fg=TEXT, insertbackground=TEXT)
+        win.protocol("WM_DELETE_WINDOW", win.withdraw)
+        txt = scrolledtext.ScrolledText(win, wrap="word", font="AppMono", bg=theme.CARD, fg=theme.TEXT, insertbackground=theme.TEXT)
         txt.pack(fill="both", expand=True, padx=12, pady=12)
-        txt.insert("1.0", text)
+        txt.insert("1.0", self._explain_text)
         txt.configure(state="disabled")
         bar = ttk.Frame(win, style="TFrame")
         bar.pack(fill="x", padx=12, pady=(0, 12))
-        def _copy():
-            self.clipboard_clear()
-            self.clipboard_append(text)
-            self.toast("Explications copiées")
-        def _export():
-            path = filedialog.asksaveasfilename(title="Exporter les explications", defaultextension=".txt", filetypes=[("Fichier texte", "*.txt"), ("Tous fichiers", "*.*")])
-            if path:
-                try:
-                    with open(path, "w", encoding="utf-8") as f:
-                        f.write(text)
-                except Exception as e:
-                    self._show_error(f"Export TXT impossible : {e}")
-                else:
-                    self.toast(f"Export TXT : {path}")
-        ttk.Button(bar, text="Copier dans le presse-papiers", command=_copy, style="Ghost.TButton").pack(side="left")
-        ttk.Button(bar, text="Exporter en .txt", command=_export, style="Ghost.TButton").pack(side="left", padx=(8, 0))
+        ttk.Button(bar, text="Copier dans le presse-papiers", command=self._copy_explanations, style="Ghost.TButton").pack(side="left")
+        ttk.Button(bar, text="Exporter en .txt", command=self._export_explanations, style="Ghost.TButton").pack(side="left", padx=(8, 0))
+        self._themed_windows.add(win)
+        self._themed_texts.add(txt)
+        self._explain_win = win
+        self._explain_txt = txt
+
+    def _copy_explanations(self):
+        self.clipboard_clear()
+        self.clipboard_append(self._explain_text)
+        self.toast("Explications copiées")
+
+    def _export_explanations(self):
+        path = filedialog.asksaveasfilename(title="Exporter les explications", defaultextension=".txt", filetypes=[("Fichier texte", "*.txt"), ("Tous fichiers", "*.*")])
+        if path:
+            try:
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(self._explain_text)
+            except Exception as e:
+                self._show_error(f"Export TXT impossible : {e}")
+            else:
+                self.toast(f"Export TXT : {path}")
 
 
 def main() -> None:
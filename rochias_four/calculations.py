@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Dict, Tuple
 
+import numpy as np
+
 from .maintenance_ref import compute_times_maintenance
 from .calibration_overrides import AnchorParams, get_current_anchor
 
@@ -187,32 +189,59 @@ def compute_simulation_plan(f1: float, f2: float, f3: float) -> CalculationResul
     )
 
 
+@dataclass(slots=True)
+class LastCalc:
+    """Snapshot of the last maintenance (L/v) calculation shown by the UI."""
+
+    f1: float
+    f2: float
+    f3: float
+    parts_reparties: Tuple[float, float, float]
+    T_total_min: float
+    total_s: float
+    t1_hms: str
+    t2_hms: str
+    t3_hms: str
+    total_hms: str
+    t1s_min: float
+    t2s_min: float
+    t3s_min: float
+    segments: Dict[str, object] | None = None
+
+    def items(self):
+        """Yield ``(name, value)`` pairs for the fields that are set."""
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if value is not None:
+                yield f.name, value
+
+
 def thickness_and_accum(f1: float, f2: float, f3: float, h0_cm: float) -> Dict[str, float]:
     """Return thickness variations between conveyors."""
 
     anch = get_current_anchor()
-    u1, u2, u3 = (f1 / anch.K1), (f2 / anch.K2), (f3 / anch.K3)
-
-    h1 = h0_cm
-    h2 = h0_cm * (u1 / u2) if u2 > 0 else float("inf")
-    h3 = h0_cm * (u1 / u3) if u3 > 0 else float("inf")
+    u = np.array((f1, f2, f3), dtype=float) / (anch.K1, anch.K2, anch.K3)
 
-    A12 = (u1 / u2) - 1.0
-    A23 = (u2 / u3) - 1.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        h = h0_cm * (u[0] / u)
+        ratios = u[:-1] / u[1:]
+    h[1:][u[1:] <= 0] = np.inf
+    pct = (ratios - 1.0) * 100.0
 
     return {
-        "h1_cm": h1,
-        "h2_cm": h2,
-        "h3_cm": h3,
-        "A12_x": A12 + 1.0,
-        "A23_x": A23 + 1.0,
-        "A12_pct": A12 * 100.0,
-        "A23_pct": A23 * 100.0,
+        "h1_cm": h0_cm,
+        "h2_cm": float(h[1]),
+        "h3_cm": float(h[2]),
+        "A12_x": float(ratios[0]),
+        "A23_x": float(ratios[1]),
+        "A12_pct": float(pct[0]),
+        "A23_pct": float(pct[1]),
     }
 
 
 __all__ = [
     "CalculationResult",
+    "LastCalc",
     "StagePlan",
     "compute_simulation_plan",
     "thickness_and_accum",
@@ -3,6 +3,8 @@
 from pathlib import Path
 
 TICK_SECONDS = 0.5
+TICK_MIN_SECONDS = 0.1
+TICK_ICONIC_SECONDS = 0.5
 PREFS_PATH = Path.home() / ".four3_prefs.json"
 DEFAULT_INPUTS = ("40.00", "50.00", "99.99")
 
@@ -85,12 +85,12 @@ class DetailsWindow(tk.Toplevel):
             return
 
         # secondes de CONVOYAGE par tapis (déjà calculées par l’app)
-        t1 = float(self.app.seg_durations[0]) if self.app.seg_durations else float(calc["t1_hms"].split("|")[0])
+        t1 = float(self.app.seg_durations[0]) if self.app.seg_durations else float(calc.t1_hms.split("|")[0])
         t2 = float(self.app.seg_durations[1]) if self.app.seg_durations else 0.0
         t3 = float(self.app.seg_durations[2]) if self.app.seg_durations else 0.0
         conv_secs = {1: t1, 2: t2, 3: t3}
 
-        freqs = {1: float(calc["f1"]), 2: float(calc["f2"]), 3: float(calc["f3"])}
+        freqs = {1: float(calc.f1), 2: float(calc.f2), 3: float(calc.f3)}
 
         for i in (1, 2, 3):
             tab = self.tabs[i]
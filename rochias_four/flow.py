@@ -4,6 +4,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Optional
 
+import numpy as np
+
 
 @dataclass
 class GapEvent:
@@ -21,23 +23,6 @@ def _normalize(events: List[GapEvent], now_min: float) -> list[tuple[float, floa
     return norm
 
 
-def _project_to_belt(
-    intervals: list[tuple[float, float]],
-    now_min: float,
-    offset_min: float,
-    belt_len_sec: float,
-) -> list[tuple[float, float]]:
-    out: list[tuple[float, float]] = []
-    for s, e in intervals:
-        a = (now_min - (e + offset_min)) * 60.0
-        b = (now_min - (s + offset_min)) * 60.0
-        lo = max(0.0, min(belt_len_sec, a))
-        hi = max(0.0, min(belt_len_sec, b))
-        if hi - lo > 1e-6:
-            out.append((lo, hi))
-    return out
-
-
 def holes_for_all_belts(
     events: List[GapEvent],
     now_min: float,
@@ -46,9 +31,16 @@ def holes_for_all_belts(
     t3_min: float,
 ) -> list[list[tuple[float, float]]]:
     intervals = _normalize(events, now_min)
-    lens = [t1_min * 60.0, t2_min * 60.0, t3_min * 60.0]
-    offsets = [0.0, t1_min, t1_min + t2_min]
+    if not intervals:
+        return [[], [], []]
+    # Colonnes début/fin projetées sur les trois tapis en une passe (3 x N).
+    starts, ends = np.asarray(intervals, dtype=float).T
+    offsets = np.array((0.0, t1_min, t1_min + t2_min))[:, None]
+    lens = np.array((t1_min, t2_min, t3_min))[:, None] * 60.0
+    lo = np.clip((now_min - (ends + offsets)) * 60.0, 0.0, lens)
+    hi = np.clip((now_min - (starts + offsets)) * 60.0, 0.0, lens)
+    keep = (hi - lo) > 1e-6
     return [
-        _project_to_belt(intervals, now_min, offsets[i], lens[i])
+        list(zip(lo[i][keep[i]].tolist(), hi[i][keep[i]].tolist()))
         for i in (0, 1, 2)
     ]
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import math
-import time
 import tkinter as tk
 from dataclasses import dataclass
 from tkinter import ttk
@@ -52,13 +51,9 @@ class GraphInputs:
 def _compute_last_or_recalc(app) -> GraphInputs:
     calc = getattr(app, "last_calc", None)
     if calc:
-        f1 = float(calc["f1"])
-        f2 = float(calc["f2"])
-        f3 = float(calc["f3"])
-        T_total = float(calc.get("T_total_min", 0.0))
-        t1s = float(calc.get("parts_reparties", (0.0, 0.0, 0.0))[0])
-        t2s = float(calc.get("parts_reparties", (0.0, 0.0, 0.0))[1])
-        t3s = float(calc.get("parts_reparties", (0.0, 0.0, 0.0))[2])
+        f1, f2, f3 = float(calc.f1), float(calc.f2), float(calc.f3)
+        T_total = float(calc.T_total_min)
+        t1s, t2s, t3s = (float(t) for t in calc.parts_reparties)
     else:
         # Fallback cohérent L/v : on recalcule avec compute_times_maintenance(units="auto")
         try:
@@ -209,9 +204,9 @@ class GraphWindow(tk.Toplevel):
         if not getattr(app, "animating", False) or getattr(app, "paused", False):
             return 0.0
         i = int(getattr(app, "seg_idx", 0))
-        elapsed = max(0.0, time.perf_counter() - getattr(app, "seg_start", time.perf_counter()))
-        past = sum(float(s) for s in app.seg_durations[:i]) / 60.0
-        return past + elapsed / 60.0
+        elapsed_ms = int(getattr(app, "seg_elapsed_ms", 0))
+        past_ms = sum(app.seg_dur_ms[:i])
+        return (past_ms + elapsed_ms) / 60000.0
 
     def _start_cursor_loop(self):
         def _tick():
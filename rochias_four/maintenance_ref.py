@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
 # --- Constantes maintenance (référence tableur L/v) ---
@@ -69,6 +70,7 @@ class MaintTimes:
     ui3: float
 
 
+@lru_cache(maxsize=64)
 def compute_times_maintenance(
     f1_in: float, f2_in: float, f3_in: float, units: Literal["auto", "hz", "ui"] = "auto"
 ) -> MaintTimes:
@@ -90,18 +90,29 @@ def _norm_block(values: dict[str, float]) -> dict[str, float]:
     return {key: float(val) / total for key, val in values.items()}
 
 
+_WEIGHTS_PATH = Path(__file__).with_name("segments_weights.json")
+_weights_cache: tuple[int, SegmentWeights] | None = None
+
+
 def load_segment_weights() -> SegmentWeights:
-    path = Path(__file__).with_name("segments_weights.json")
-    if path.exists():
-        try:
-            raw = json.loads(path.read_text(encoding="utf-8"))
-            k1 = _norm_block(raw.get("k1", _DEFAULT.k1))
-            k2 = _norm_block(raw.get("k2", _DEFAULT.k2))
-            k3 = _norm_block(raw.get("k3", _DEFAULT.k3))
-            return SegmentWeights(k1=k1, k2=k2, k3=k3)
-        except Exception:
-            pass
-    return _DEFAULT
+    """Charge les poids du fichier JSON, relu seulement s'il a changé."""
+    global _weights_cache
+    try:
+        mtime = _WEIGHTS_PATH.stat().st_mtime_ns
+    except OSError:
+        return _DEFAULT
+    if _weights_cache is not None and _weights_cache[0] == mtime:
+        return _weights_cache[1]
+    try:
+        raw = json.loads(_WEIGHTS_PATH.read_text(encoding="utf-8"))
+        k1 = _norm_block(raw.get("k1", _DEFAULT.k1))
+        k2 = _norm_block(raw.get("k2", _DEFAULT.k2))
+        k3 = _norm_block(raw.get("k3", _DEFAULT.k3))
+        weights = SegmentWeights(k1=k1, k2=k2, k3=k3)
+    except Exception:
+        weights = _DEFAULT
+    _weights_cache = (mtime, weights)
+    return weights
 
 
 def compute_segment_times_minutes(
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 
 
 def parse_hz(raw: str) -> float:
@@ -14,12 +15,8 @@ def parse_hz(raw: str) -> float:
     return (value / 100.0) if value > 200.0 else value
 
 
-def fmt_minutes(value: float) -> str:
-    if value is None or not math.isfinite(value):
-        return "?"
-    if value < 0:
-        value = 0.0
-    total_seconds = int(round(value * 60))
+@lru_cache(maxsize=512)
+def _minutes_text(total_seconds: int) -> str:
     hours = total_seconds // 3600
     total_seconds %= 3600
     minutes = total_seconds // 60
@@ -29,9 +26,21 @@ def fmt_minutes(value: float) -> str:
     return f"{minutes}min {seconds:02d}s"
 
 
-def fmt_hms(seconds: float) -> str:
-    seconds = max(0, int(seconds + 0.5))
+@lru_cache(maxsize=512)
+def _hms_text(seconds: int) -> str:
     hours = seconds // 3600
     minutes = (seconds % 3600) // 60
     secs = seconds % 60
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+def fmt_minutes(value: float) -> str:
+    if value is None or not math.isfinite(value):
+        return "?"
+    if value < 0:
+        value = 0.0
+    return _minutes_text(int(round(value * 60)))
+
+
+def fmt_hms(seconds: float) -> str:
+    return _hms_text(max(0, int(seconds + 0.5)))
@@ -358,12 +358,17 @@ class Tooltip:
 
 
 class Collapsible(ttk.Frame):
-    """Disclosure widget offering a collapsible body."""
+    """Disclosure widget offering a collapsible body.
 
-    def __init__(self, master, title="Détails", open=False):
+    ``builder`` is called with the body frame the first time it is shown,
+    so expensive content can be created on demand.
+    """
+
+    def __init__(self, master, title="Détails", open=False, builder=None):
         super().__init__(master, style="CardInner.TFrame")
         self._open = bool(open)
         self._title = title
+        self._builder = builder
         header = ttk.Frame(self, style="CardInner.TFrame")
         header.pack(fill="x")
         self._btn = ttk.Button(
@@ -376,7 +381,13 @@ class Collapsible(ttk.Frame):
         self._btn.pack(side="left")
         self.body = ttk.Frame(self, style="CardInner.TFrame")
         if self._open:
-            self.body.pack(fill="both", expand=True, pady=(6, 0))
+            self._show_body()
+
+    def _show_body(self):
+        if self._builder is not None:
+            builder, self._builder = self._builder, None
+            builder(self.body)
+        self.body.pack(fill="both", expand=True, pady=(6, 0))
 
     def _label_text(self):
         return ("[-] " if self._open else "[+] ") + self._title
@@ -385,7 +396,7 @@ class Collapsible(ttk.Frame):
         self._open = not self._open
         self._btn.config(text=self._label_text())
         if self._open:
-            self.body.pack(fill="both", expand=True, pady=(6, 0))
+            self._show_body()
         else:
             self.body.forget()
 
@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from rochias_four import app
+from rochias_four.theme_manager import THEME_PRESETS
+
+
+def _baseline_blend(color_a: str, color_b: str, ratio: float) -> str:
+    ratio = max(0.0, min(1.0, float(ratio)))
+
+    def _to_rgb(value: str) -> tuple[int, int, int]:
+        value = value.strip().lstrip("#")
+        if len(value) != 6:
+            value = value[:6].ljust(6, "0")
+        return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))
+
+    r1, g1, b1 = _to_rgb(color_a)
+    r2, g2, b2 = _to_rgb(color_b)
+    r = round(r1 + (r2 - r1) * ratio)
+    g = round(g1 + (g2 - g1) * ratio)
+    b = round(b1 + (b2 - b1) * ratio)
+    return f"#{max(0, min(255, r)):02X}{max(0, min(255, g)):02X}{max(0, min(255, b)):02X}"
+
+
+@pytest.mark.parametrize("name", sorted(THEME_PRESETS))
+def test_palette_cache_matches_baseline_blend(name, monkeypatch):
+    monkeypatch.setattr(app, "_blend_colors", _baseline_blend)
+    assert app._PALETTE_CACHE[name] == app._build_palette(THEME_PRESETS[name])
+
+
+def test_blend_matches_baseline_rounding():
+    rng = random.Random(0)
+    for _ in range(20000):
+        a = "#%06X" % rng.randrange(1 << 24)
+        b = "#%06X" % rng.randrange(1 << 24)
+        ratio = rng.choice((rng.random(), rng.randrange(1001) / 1000))
+        assert app._blend_colors(a, b, ratio) == _baseline_blend(a, b, ratio)